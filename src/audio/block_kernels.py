@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Per-block numeric kernels used on the real-time audio callback path.
+
+When numba is installed the kernels are compiled ahead of use (explicit
+signatures, cached on disk) so the stream callback runs compiled code instead
+of several NumPy calls. Without numba the same functions fall back to
+vectorized NumPy operations on caller-provided scratch buffers.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit("UniTuple(int64, 2)(int16[:, ::1])", cache=True, boundscheck=False)
+    def _envelope_jit(block):
+        peak = 0
+        sum_sq = 0
+        for i in range(block.shape[0]):
+            for c in range(block.shape[1]):
+                v = np.int64(block[i, c])
+                sum_sq += v * v
+                if v < 0:
+                    v = -v
+                if v > peak:
+                    peak = v
+        return peak, sum_sq
+
+    @numba.njit("void(int16[:, ::1], float32[:, ::1], float32)", cache=True, boundscheck=False)
+    def _to_float32_jit(block, out, scale):
+        for i in range(block.shape[0]):
+            for c in range(block.shape[1]):
+                out[i, c] = np.float32(block[i, c]) * scale
+
+
+def int16_envelope(block: np.ndarray, sq_scratch: np.ndarray) -> Tuple[int, int]:
+    """
+    Compute the absolute peak and sum of squares of an int16 block.
+
+    Args:
+        block: C-contiguous int16 block of shape (frames, channels)
+        sq_scratch: int32 scratch of the same shape (unused by the numba path)
+
+    Returns:
+        (peak, sum_sq) as Python ints
+    """
+    if NUMBA_AVAILABLE:
+        return _envelope_jit(block)
+
+    # 32768**2 fits in int32; accumulate the sum in int64
+    np.square(block, out=sq_scratch, dtype=np.int32)
+    sum_sq = int(sq_scratch.sum(dtype=np.int64))
+    peak = max(int(block.max()), -int(block.min()))
+    return peak, sum_sq
+
+
+def int16_to_float32(block: np.ndarray, out: np.ndarray, scale: np.float32) -> None:
+    """
+    Convert an int16 block to scaled float32 into a pre-allocated buffer.
+
+    Args:
+        block: C-contiguous int16 block of shape (frames, channels)
+        out: C-contiguous float32 buffer of the same shape
+        scale: Scale factor applied to each sample
+    """
+    if NUMBA_AVAILABLE:
+        _to_float32_jit(block, out, scale)
+    else:
+        np.multiply(block, scale, out=out)
+
+
+def downmix_int16(block: np.ndarray, sum_scratch: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Average the channels of an int16 block into a pre-allocated mono buffer.
+
+    Args:
+        block: int16 block of shape (frames, channels)
+        sum_scratch: int32 scratch of shape (frames, 1)
+        out: int16 destination of shape (frames, 1)
+
+    Returns:
+        `out`, holding the per-frame channel mean rounded toward -inf
+    """
+    np.sum(block, axis=1, dtype=np.int32, out=sum_scratch, keepdims=True)
+    np.floor_divide(sum_scratch, block.shape[1], out=out, casting='unsafe')
+    return out
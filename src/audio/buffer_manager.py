@@ -21,7 +21,8 @@ import weakref
 
 from .device_config import AudioDeviceManager, AudioConfig
 from .memory_manager import MemoryMonitor, ResourceManager, AudioBufferTracker
-from .recorder import AudioRecorder, StreamStatus, StreamError
+from .recorder import AudioRecorder, StreamStatus, StreamError, flush_threshold_frames
+from .ring_buffer import BufferPool
 
 
 class AudioBuffer:
@@ -197,10 +198,18 @@ class StreamingAudioManager:
         # Streaming state
         self.is_recording = False
         self.audio_queue = queue.Queue()
+        
+        # Block buffers handed from the recorder worker to the processing thread
+        # are recycled instead of allocated per block (~1s of audio in flight)
+        self.chunk_pool = BufferPool(
+            pool_size=8,
+            shape=(self.recorder.blocksize, self.config.channels),
+            dtype=np.int16
+        )
         self.stop_processing = threading.Event()
         self.processing_thread = None
         
-        # Callbacks
+        # Callbacks (on_audio_data gets a pooled block, valid only during the call)
         self.on_audio_data: Optional[Callable[[np.ndarray], None]] = None
         self.on_buffer_full: Optional[Callable[[np.ndarray], None]] = None
         self.on_stream_error: Optional[Callable[[Exception], None]] = None
@@ -221,11 +230,12 @@ class StreamingAudioManager:
         device = self.device_manager.get_current_device()
         device_id = device.device_id if device else None
         
+        # Audio here only feeds transcription, so favour fewer, larger blocks
         self.recorder = AudioRecorder(
             device_id=device_id,
             sample_rate=self.config.sample_rate,
             channels=self.config.channels,
-            blocksize=1024
+            blocksize=flush_threshold_frames('whisper', self.config.sample_rate)
         )
         
         # Set up callbacks
@@ -296,10 +306,14 @@ class StreamingAudioManager:
     def _audio_callback(self, indata: np.ndarray) -> None:
         """Callback for audio stream data from the enhanced recorder."""
         if self.is_recording:
-            # Put data in queue for processing
+            # Copy the (ring-owned) block into a pooled buffer for processing
+            chunk = self.chunk_pool.acquire()
+            frames = len(indata)
+            np.copyto(chunk[:frames], indata)
             try:
-                self.audio_queue.put_nowait(indata.copy())
+                self.audio_queue.put_nowait((chunk, frames))
             except queue.Full:
+                self.chunk_pool.release(chunk)
                 self.logger.warning("Audio queue full, dropping data")
 
     def _on_stream_error(self, error: Exception) -> None:
@@ -329,15 +343,19 @@ class StreamingAudioManager:
         while not self.stop_processing.is_set():
             try:
                 # Get data with timeout
-                audio_data = self.audio_queue.get(timeout=0.1)
+                chunk, frames = self.audio_queue.get(timeout=0.1)
+                audio_data = chunk[:frames]
                 
-                # Write to buffer
-                if self.buffer:
-                    self.buffer.write(audio_data)
-                    
-                    # Call audio data callback
-                    if self.on_audio_data:
-                        self.on_audio_data(audio_data)
+                try:
+                    # Write to buffer
+                    if self.buffer:
+                        self.buffer.write(audio_data)
+                        
+                        # Call audio data callback (data is only valid during the call)
+                        if self.on_audio_data:
+                            self.on_audio_data(audio_data)
+                finally:
+                    self.chunk_pool.release(chunk)
                     
                 # Check memory usage periodically
                 if self.memory_monitor.is_memory_high():
@@ -435,9 +453,10 @@ class StreamingAudioManager:
             # Clear audio queue
             while not self.audio_queue.empty():
                 try:
-                    self.audio_queue.get_nowait()
+                    chunk, _ = self.audio_queue.get_nowait()
                 except queue.Empty:
                     break
+                self.chunk_pool.release(chunk)
             
             # Clear buffer if it's getting full
             if self.buffer and self.buffer.get_fill_level() > 0.8:
@@ -6,12 +6,16 @@ Handles real-time audio recording using sounddevice with robust error recovery.
 import sounddevice as sd
 import numpy as np
 import logging
+import math
 import time
 import threading
-from typing import Optional, Callable, Dict, Any
+import queue
+from typing import Optional, Callable, Dict, Any, NamedTuple
 from enum import Enum
 
 from .silence_detector import SilenceDetector, SilenceConfig, DetectionStrategy
+from .ring_buffer import BlockRingBuffer, aligned_empty
+from .block_kernels import downmix_int16, int16_envelope, int16_to_float32
 
 class StreamStatus(Enum):
     """Audio stream status enumeration."""
@@ -21,10 +25,55 @@ class StreamStatus(Enum):
     ERROR = "error"
     RECOVERING = "recovering"
 
+# Frames per stream block for each kind of downstream consumer (at 16 kHz).
+# Larger blocks mean fewer callbacks and less per-block overhead, at the cost
+# of latency.
+CONSUMER_BLOCKSIZES = {
+    'waveform': 1024,  # 64 ms: smooth live visualization
+    'whisper': 4096,   # 256 ms: Whisper consumes seconds of audio at a time
+}
+
+def flush_threshold_frames(consumer: str, sample_rate: int = 16000) -> int:
+    """
+    Pick the stream blocksize for a downstream consumer.
+    
+    Args:
+        consumer: Consumer kind, a key of CONSUMER_BLOCKSIZES
+        sample_rate: Stream sample rate in Hz
+        
+    Returns:
+        Number of frames per block, scaled to the sample rate
+    """
+    frames = CONSUMER_BLOCKSIZES.get(consumer, CONSUMER_BLOCKSIZES['waveform'])
+    return max(1, frames * sample_rate // 16000)
+
+class ErrorSeverity(Enum):
+    """How much of the stream has to be rebuilt to recover from an error."""
+    TRANSIENT = "transient"  # stop()/start() on the existing stream is enough
+    FATAL = "fatal"          # the stream must be closed and reopened
+
+class RealtimeEvent(Enum):
+    """Events posted by the real-time stream callback for the worker thread."""
+    INPUT_UNDERFLOW = "input_underflow"
+    INPUT_OVERFLOW = "input_overflow"
+    CRITICAL_ERROR = "critical_error"
+
 class StreamError(Exception):
     """Custom exception for stream-related errors."""
     pass
 
+class HealthSnapshot(NamedTuple):
+    """
+    Immutable copy of the lock-protected recorder state.
+    
+    Writers rebuild it while holding the lock and publish it with a single
+    reference assignment, so readers can use it without taking the lock.
+    """
+    status: StreamStatus
+    stream_start_time: float
+    retry_attempts: int
+    last_error_time: float
+
 class AudioRecorder:
     """
     Manages the audio recording stream from an input device with robust error recovery.
@@ -59,12 +108,17 @@ class AudioRecorder:
         self.stream: Optional[sd.InputStream] = None
         self.status = StreamStatus.STOPPED
         
+        # Mirror of self.stream.active, updated whenever this class starts or
+        # stops the stream, so health queries never cross into PortAudio
+        self._cached_active = False
+        
         # Error recovery configuration
         self.max_retry_attempts = 5
         self.base_retry_delay = 1.0  # seconds
         self.max_retry_delay = 30.0  # seconds
         self.retry_attempts = 0
         self.last_error_time = 0.0
+        self._error_severity = ErrorSeverity.FATAL
         
         # Stream health monitoring
         self.stream_start_time = 0.0
@@ -72,13 +126,48 @@ class AudioRecorder:
         self.error_count = 0
         self.underrun_count = 0
         self.overrun_count = 0
+        self.health_report_interval = 10.0  # seconds
+        self._next_health_ts = 0.0
         
         # Thread safety
         self._lock = threading.Lock()
+        self._snapshot = HealthSnapshot(self.status, 0.0, 0, 0.0)
+        
+        # Per-state stream callback body, swapped on status changes so the
+        # real-time path never branches on status
+        self._active_cb = self._cb_idle
         self._recovery_thread: Optional[threading.Thread] = None
         self._stop_recovery = threading.Event()
         
-        # This callback will be invoked with new audio chunks
+        # Hand-off from the real-time stream callback to the worker thread.
+        # The ring is allocated once so the callback never allocates.
+        self.ring_capacity = 32  # blocks (~2s at 16kHz/1024)
+        self._ring = BlockRingBuffer(self.ring_capacity, blocksize, channels)
+        self._worker_thread: Optional[threading.Thread] = None
+        self._stop_worker = threading.Event()
+        self._worker_poll_interval = blocksize / sample_rate / 2
+        self._reported_drops = 0
+        
+        # Scale for converting buffered int16 audio to float32 for transcription
+        self._inv_int16_scale = np.float32(1.0 / 32767.0)
+        
+        # Scratch buffer for squared int16 samples (32768**2 fits in int32),
+        # used by the worker when computing envelopes for the silence detector
+        self._sq_scratch = aligned_empty((blocksize, 1), dtype=np.int32)
+        
+        # Scratch buffers for downmixing multi-channel blocks to the mono signal
+        # the silence detector analyzes (int32 channel sum, then int16 mean)
+        self._mono_sum = aligned_empty((blocksize, 1), dtype=np.int32)
+        self._mono_scratch = aligned_empty((blocksize, 1), dtype=np.int16)
+        
+        # Events and errors raised on the real-time thread are posted here as
+        # (RealtimeEvent, payload) tuples and logged/handled by the worker
+        # thread, so the callback never formats strings, logs or takes self._lock
+        self._rt_events: queue.SimpleQueue = queue.SimpleQueue()
+        
+        # This callback will be invoked (from the worker thread) with new audio chunks.
+        # The chunk is a view into the ring buffer and is only valid during the call;
+        # consumers that keep the data must copy it.
         self.audio_chunk_callback: Optional[Callable[[np.ndarray], None]] = None
         
         # Error callbacks
@@ -104,56 +193,167 @@ class AudioRecorder:
         """
         This is called (from a separate thread) for each audio block from the stream.
         Includes comprehensive error handling and health monitoring.
+        
+        Runs on the real-time PortAudio thread and never takes self._lock. PortAudio
+        binds this method when the stream is created, so it only trampolines to
+        the variant for the current status (self._active_cb); state changes are
+        posted to the worker thread instead.
         """
         try:
-            # Update health metrics
-            self.total_samples_processed += frames
+            self._active_cb(indata, frames, status)
+        except Exception as e:
+            # Defer handling (lock, callbacks, recovery) to the worker thread
+            self._rt_events.put_nowait((RealtimeEvent.CRITICAL_ERROR, e))
+
+    def _cb_running(self, indata: np.ndarray, frames: int, status: sd.CallbackFlags):
+        """Stream callback body while the recorder is running."""
+        # Update health metrics
+        self.total_samples_processed += frames
+        
+        # Handle stream status flags
+        if status:
+            self._handle_stream_status(status, frames)
+        
+        # Hand the block to the worker thread, which feeds the silence
+        # detector and the chunk callback; no allocation on this thread
+        self._ring.push(indata)
+
+    def _cb_idle(self, indata: np.ndarray, frames: int, status: sd.CallbackFlags):
+        """Stream callback body while starting, recovering or stopped: metrics only."""
+        self.total_samples_processed += frames
+        
+        if status:
+            self._handle_stream_status(status, frames)
+
+    def _drain_rt_events(self):
+        """Log and handle events posted by the stream callback (worker thread only)."""
+        while True:
+            try:
+                event, payload = self._rt_events.get_nowait()
+            except queue.Empty:
+                return
             
-            # Handle stream status flags
-            if status:
-                self._handle_stream_status(status, frames)
+            if event is RealtimeEvent.INPUT_UNDERFLOW:
+                self.logger.warning(f"Input underflow detected (frame {payload})")
+            elif event is RealtimeEvent.INPUT_OVERFLOW:
+                self.logger.warning(f"Input overflow detected (frame {payload})")
+            elif event is RealtimeEvent.CRITICAL_ERROR:
+                self.logger.error(f"Critical error in stream callback: {payload}")
+                self._handle_critical_error(payload)
+
+    def _downmix_to_mono(self, block: np.ndarray) -> np.ndarray:
+        """
+        Average the channels of an int16 block into the mono scratch buffer.
+        
+        Args:
+            block: int16 block of shape (frames, channels)
+            
+        Returns:
+            Mono int16 block of shape (frames, 1); the input itself if already mono
+        """
+        if self.channels == 1:
+            return block
+        
+        frames = len(block)
+        return downmix_int16(block, self._mono_sum[:frames], self._mono_scratch[:frames])
+
+    def _feed_silence_detector(self, block: np.ndarray):
+        """Feed one block to the silence detector, only when it wants data (worker thread only)."""
+        detector = self.silence_detector
+        try:
+            if detector.wants_samples():
+                # The detector works on int16 natively; no conversion. It
+                # keeps the samples for transcription whatever the strategy.
+                mono = self._downmix_to_mono(block)
+                detector.add_audio_data_int16(mono)
+                if detector.wants_envelope():
+                    # Energy-only strategies analyze the block envelope
+                    frames = len(mono)
+                    peak, sum_sq = int16_envelope(mono, self._sq_scratch[:frames])
+                    detector.add_envelope(peak, sum_sq, frames)
+        except Exception as e:
+            self.logger.error(f"Error feeding audio to silence detector: {e}")
+
+    def _report_dropped_blocks(self):
+        """Log blocks the stream callback had to drop because the worker fell behind."""
+        dropped = self._ring.dropped_blocks
+        if dropped != self._reported_drops:
+            self.logger.warning(f"Audio worker fell behind, dropped {dropped - self._reported_drops} "
+                                f"block(s) ({dropped} total)")
+            self._reported_drops = dropped
+
+    def _worker_loop(self):
+        """Worker thread that drains the ring buffer, feeds the silence detector and invokes the chunk callback."""
+        while not self._stop_worker.is_set():
+            self._drain_rt_events()
+            self._report_dropped_blocks()
+            
+            # Periodic health report on a monotonic deadline
+            now = time.monotonic()
+            if now >= self._next_health_ts:
+                self._next_health_ts = now + self.health_report_interval
+                self._report_health_status()
+            
+            block = self._ring.peek()
+            if block is None:
+                # Nothing queued; sleep for about half a block
+                self._stop_worker.wait(self._worker_poll_interval)
+                continue
+            
+            self._feed_silence_detector(block)
             
-            # Process audio data if callback is available
-            if self.audio_chunk_callback and self.status == StreamStatus.RUNNING:
+            callback = self.audio_chunk_callback
+            if callback:
                 try:
-                    # Pass a copy of the audio data to the callback
-                    self.audio_chunk_callback(indata.copy())
+                    callback(block)
                 except Exception as e:
                     self.logger.error(f"Error in audio chunk callback: {e}")
                     self._handle_callback_error(e)
             
-            # Feed audio data to silence detector
-            if self.status == StreamStatus.RUNNING and self.silence_detector.is_active:
-                try:
-                    # Convert int16 to float32 for silence detection
-                    audio_float = indata.astype(np.float32) / 32767.0
-                    self.silence_detector.add_audio_data(audio_float)
-                except Exception as e:
-                    self.logger.error(f"Error feeding audio to silence detector: {e}")
-            
-        except Exception as e:
-            self.logger.error(f"Critical error in stream callback: {e}")
-            self._handle_critical_error(e)
+            self._ring.advance()
+
+    def _start_worker(self):
+        """Start the ring buffer worker thread."""
+        if self._worker_thread and self._worker_thread.is_alive():
+            return
+        
+        self._ring.reset()
+        self._reported_drops = 0
+        self._next_health_ts = time.monotonic() + self.health_report_interval
+        self._stop_worker.clear()
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+
+    def _stop_worker_thread(self):
+        """Stop the ring buffer worker thread."""
+        self._stop_worker.set()
+        if (self._worker_thread and self._worker_thread.is_alive()
+                and self._worker_thread is not threading.current_thread()):
+            self._worker_thread.join(timeout=2.0)
+        self._worker_thread = None
 
     def _handle_stream_status(self, status: sd.CallbackFlags, frames: int):
-        """Handle stream status flags and update health metrics."""
+        """
+        Handle stream status flags and update health metrics.
+        
+        Runs on the real-time thread, so logging is deferred to the worker.
+        """
         if status.input_underflow:
             self.underrun_count += 1
-            self.logger.warning(f"Input underflow detected (frame {frames})")
+            self._rt_events.put_nowait((RealtimeEvent.INPUT_UNDERFLOW, frames))
             
         if status.input_overflow:
             self.overrun_count += 1
-            self.logger.warning(f"Input overflow detected (frame {frames})")
-            
-        # Log periodic health updates
-        if self.total_samples_processed % (self.sample_rate * 10) == 0:  # Every 10 seconds
-            self._report_health_status()
+            self._rt_events.put_nowait((RealtimeEvent.INPUT_OVERFLOW, frames))
 
     def _handle_stream_closure(self):
         """Handle unexpected stream closure."""
         with self._lock:
             if self.status == StreamStatus.RUNNING:
                 self.status = StreamStatus.ERROR
+                self._error_severity = ErrorSeverity.FATAL
+                self._cached_active = False
+                self._publish_snapshot()
                 self.logger.error("Stream unexpectedly closed")
                 self._schedule_recovery()
 
@@ -173,6 +373,8 @@ class AudioRecorder:
             self.status = StreamStatus.ERROR
             self.error_count += 1
             self.last_error_time = time.time()
+            self._error_severity = self._classify_error(error)
+            self._publish_snapshot()
             
         self.logger.error(f"Critical stream error: {error}")
         
@@ -186,6 +388,18 @@ class AudioRecorder:
         # Schedule recovery
         self._schedule_recovery()
 
+    def _classify_error(self, error: Exception) -> ErrorSeverity:
+        """
+        Decide whether an error left the PortAudio stream itself unusable.
+        
+        PortAudio errors (device lost, host API failure) require reopening the
+        stream; anything else came from our own processing and a stop/start
+        cycle on the existing stream is enough.
+        """
+        if isinstance(error, sd.PortAudioError):
+            return ErrorSeverity.FATAL
+        return ErrorSeverity.TRANSIENT
+
     def _schedule_recovery(self):
         """Schedule automatic stream recovery."""
         if self._recovery_thread and self._recovery_thread.is_alive():
@@ -205,11 +419,14 @@ class AudioRecorder:
                     
                     self.status = StreamStatus.RECOVERING
                     self.retry_attempts += 1
+                    self._publish_snapshot()
                 
                 self.logger.info(f"Attempting stream recovery (attempt {self.retry_attempts}/{self.max_retry_attempts})")
                 
-                # Calculate delay with exponential backoff
-                delay = min(self.base_retry_delay * (2 ** (self.retry_attempts - 1)), self.max_retry_delay)
+                # Calculate delay with exponential backoff (ldexp: base * 2**n in one C
+                # call; the exponent cap keeps it finite however many attempts are made)
+                delay = min(math.ldexp(self.base_retry_delay, min(self.retry_attempts - 1, 20)),
+                            self.max_retry_delay)
                 time.sleep(delay)
                 
                 # Attempt to restart the stream
@@ -223,35 +440,64 @@ class AudioRecorder:
                         self.logger.error("Maximum recovery attempts reached, giving up")
                         with self._lock:
                             self.status = StreamStatus.ERROR
+                            self._publish_snapshot()
                         break
                         
             except Exception as e:
                 self.logger.error(f"Error during recovery: {e}")
                 time.sleep(self.base_retry_delay)
 
+    def _restart_existing_stream(self) -> bool:
+        """
+        Restart the current stream in place after a transient error.
+        
+        Reuses the InputStream (and PortAudio's buffers) instead of reopening
+        the device.
+        
+        Returns:
+            True if the existing stream was restarted, False if it must be rebuilt
+        """
+        if self._error_severity is not ErrorSeverity.TRANSIENT or self.stream is None:
+            return False
+        
+        try:
+            if self.stream.active:
+                self._cached_active = False
+                self.stream.stop()
+            self.stream.start()
+            self._cached_active = True
+            self.logger.info("Stream restarted in place")
+            return True
+        except Exception as e:
+            self.logger.warning(f"In-place stream restart failed, reopening stream: {e}")
+            return False
+
     def _attempt_stream_restart(self) -> bool:
         """Attempt to restart the audio stream."""
         try:
-            # Clean up existing stream
-            self._cleanup_stream()
-            
-            # Create new stream
-            self.stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                device=self.device_id,
-                channels=self.channels,
-                dtype='int16',  # 16-bit audio, standard for Whisper
-                blocksize=self.blocksize,
-                callback=self._stream_callback
-            )
-            
-            # Start the stream
-            self.stream.start()
+            if not self._restart_existing_stream():
+                # Clean up existing stream
+                self._cleanup_stream()
+                
+                # Create new stream
+                self.stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    device=self.device_id,
+                    channels=self.channels,
+                    dtype='int16',  # 16-bit audio, standard for Whisper
+                    blocksize=self.blocksize,
+                    callback=self._stream_callback
+                )
+                
+                # Start the stream
+                self.stream.start()
+                self._cached_active = True
             
             with self._lock:
                 self.status = StreamStatus.RUNNING
                 self.stream_start_time = time.time()
                 self.retry_attempts = 0  # Reset retry counter on success
+                self._publish_snapshot()
             
             self.logger.info("Stream restarted successfully")
             
@@ -268,10 +514,12 @@ class AudioRecorder:
             self.logger.error(f"Failed to restart stream: {e}")
             with self._lock:
                 self.status = StreamStatus.ERROR
+                self._publish_snapshot()
             return False
 
     def _cleanup_stream(self):
         """Clean up the current stream safely."""
+        self._cached_active = False
         if self.stream:
             try:
                 if self.stream.active:
@@ -284,6 +532,10 @@ class AudioRecorder:
 
     def _report_health_status(self):
         """Report stream health status."""
+        # Nothing consumes the report: skip building it
+        if not self.on_stream_health_update and not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         uptime = time.time() - self.stream_start_time if self.stream_start_time > 0 else 0
         
         health_data = {
@@ -300,7 +552,7 @@ class AudioRecorder:
             'blocksize': self.blocksize
         }
         
-        self.logger.debug(f"Stream health: {health_data}")
+        self.logger.debug("Stream health: %s", health_data)
         
         # Notify health callback
         if self.on_stream_health_update:
@@ -317,10 +569,13 @@ class AudioRecorder:
                 return
 
             self.status = StreamStatus.STARTING
+            self._publish_snapshot()
 
         self.logger.info(f"Starting audio stream on device {self.device_id} with {self.sample_rate}Hz, {self.channels} channels.")
         
         try:
+            self._start_worker()
+            
             self.stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 device=self.device_id,
@@ -330,6 +585,7 @@ class AudioRecorder:
                 callback=self._stream_callback
             )
             self.stream.start()
+            self._cached_active = True
             
             with self._lock:
                 self.status = StreamStatus.RUNNING
@@ -340,6 +596,7 @@ class AudioRecorder:
                 self.overrun_count = 0
                 self.total_samples_processed = 0
                 self.is_recording = True
+                self._publish_snapshot()
             
             # Start silence detection
             self.silence_detector.start()
@@ -351,7 +608,10 @@ class AudioRecorder:
             with self._lock:
                 self.status = StreamStatus.ERROR
                 self.is_recording = False
+                self._publish_snapshot()
             self.stream = None
+            self._cached_active = False
+            self._stop_worker_thread()
             raise StreamError(f"Failed to start audio stream: {e}")
 
     def stop(self):
@@ -365,6 +625,7 @@ class AudioRecorder:
             self._stop_recovery.set()
             self.status = StreamStatus.STOPPED
             self.is_recording = False
+            self._publish_snapshot()
 
         # Stop silence detection
         self.silence_detector.stop()
@@ -375,51 +636,64 @@ class AudioRecorder:
 
         try:
             self._cleanup_stream()
+            self._stop_worker_thread()
             self.logger.info("Audio stream stopped successfully.")
         except Exception as e:
             self.logger.error(f"Failed to stop audio stream cleanly: {e}")
 
+    def _publish_snapshot(self):
+        """Publish the current lock-protected state. Must be called with self._lock held."""
+        self._snapshot = HealthSnapshot(
+            self.status, self.stream_start_time, self.retry_attempts, self.last_error_time
+        )
+        self._active_cb = self._cb_running if self.status is StreamStatus.RUNNING else self._cb_idle
+
     def get_status(self) -> StreamStatus:
-        """Get the current stream status."""
-        with self._lock:
-            return self.status
+        """Get the current stream status (lock-free)."""
+        return self._snapshot.status
 
     def get_health_info(self) -> Dict[str, Any]:
-        """Get comprehensive health information about the stream."""
-        with self._lock:
-            uptime = time.time() - self.stream_start_time if self.stream_start_time > 0 else 0
-            
-            return {
-                'status': self.status.value,
-                'uptime_seconds': uptime,
-                'total_samples_processed': self.total_samples_processed,
-                'error_count': self.error_count,
-                'underrun_count': self.underrun_count,
-                'overrun_count': self.overrun_count,
-                'retry_attempts': self.retry_attempts,
-                'last_error_time': self.last_error_time,
-                'device_id': self.device_id,
-                'sample_rate': self.sample_rate,
-                'channels': self.channels,
-                'blocksize': self.blocksize,
-                'is_stream_active': self.stream.active if self.stream else False
-            }
+        """
+        Get comprehensive health information about the stream.
+        
+        Lock-free: reads the published snapshot plus counters that are only
+        ever incremented (single reference loads). Stream activity comes from
+        a cached flag rather than a PortAudio query.
+        """
+        snap = self._snapshot
+        uptime = time.time() - snap.stream_start_time if snap.stream_start_time > 0 else 0
+        
+        return {
+            'status': snap.status.value,
+            'uptime_seconds': uptime,
+            'total_samples_processed': self.total_samples_processed,
+            'error_count': self.error_count,
+            'underrun_count': self.underrun_count,
+            'overrun_count': self.overrun_count,
+            'retry_attempts': snap.retry_attempts,
+            'last_error_time': snap.last_error_time,
+            'device_id': self.device_id,
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'blocksize': self.blocksize,
+            'dropped_blocks': self._ring.dropped_blocks,
+            'is_stream_active': self._cached_active
+        }
 
     def is_healthy(self) -> bool:
-        """Check if the stream is in a healthy state."""
-        with self._lock:
-            if self.status != StreamStatus.RUNNING:
-                return False
-            
-            # Consider stream unhealthy if too many errors
-            if self.error_count > 20:
-                return False
-            
-            # Consider stream unhealthy if too many underruns/overruns
-            if self.underrun_count > 50 or self.overrun_count > 50:
-                return False
-            
-            return True
+        """Check if the stream is in a healthy state (lock-free)."""
+        if self._snapshot.status is not StreamStatus.RUNNING:
+            return False
+        
+        # Consider stream unhealthy if too many errors
+        if self.error_count > 20:
+            return False
+        
+        # Consider stream unhealthy if too many underruns/overruns
+        if self.underrun_count > 50 or self.overrun_count > 50:
+            return False
+        
+        return True
 
     def force_recovery(self):
         """Force a recovery attempt even if not in error state."""
@@ -517,18 +791,17 @@ class AudioRecorder:
             Audio data as numpy array, or None if no data available
         """
         try:
-            # Get audio buffer from silence detector
-            if hasattr(self.silence_detector, 'audio_buffer') and self.silence_detector.audio_buffer:
-                # Convert deque to numpy array
-                audio_data = np.array(list(self.silence_detector.audio_buffer))
-                if len(audio_data) > 0:
-                    self.logger.debug(f"Retrieved audio buffer with {len(audio_data)} samples")
-                    return audio_data
-                else:
-                    self.logger.debug("Audio buffer is empty")
-                    return None
+            # Linearize the silence detector's int16 sample ring and convert it
+            # to float32 in a single pass
+            samples = self.silence_detector.get_audio_buffer()
+            if samples is not None:
+                audio_data = aligned_empty(len(samples), dtype=np.float32)
+                int16_to_float32(samples.reshape(-1, 1), audio_data.reshape(-1, 1),
+                                 self._inv_int16_scale)
+                self.logger.debug("Retrieved audio buffer with %d samples", len(audio_data))
+                return audio_data
             else:
-                self.logger.debug("No audio buffer available")
+                self.logger.debug("Audio buffer is empty")
                 return None
                 
         except Exception as e:
@@ -538,8 +811,7 @@ class AudioRecorder:
     def clear_audio_buffer(self) -> None:
         """Clear the audio buffer."""
         try:
-            if hasattr(self.silence_detector, 'audio_buffer'):
-                self.silence_detector.audio_buffer.clear()
-                self.logger.debug("Audio buffer cleared")
+            self.silence_detector.audio_buffer.clear()
+            self.logger.debug("Audio buffer cleared")
         except Exception as e:
             self.logger.error(f"Error clearing audio buffer: {e}") 
\ No newline at end of file
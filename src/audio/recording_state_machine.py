@@ -8,46 +8,84 @@ error handling, and thread safety.
 
 import logging
 import threading
-from enum import Enum, auto
-from typing import Optional, Callable, Dict, Any
+import time
+from collections import defaultdict, deque
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Optional, Callable, Any, List, Mapping, Tuple
 from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
-class RecordingState(Enum):
-    """Recording session states."""
-    IDLE = auto()           # Ready to start recording
-    MODEL_LOADING = auto()  # Loading a transcription model
-    RECORDING = auto()      # Actively recording
-    STOPPING = auto()       # Transitional state during cleanup
-    FINISHED = auto()       # Recording completed successfully
-    ABORTED = auto()        # Recording was cancelled
-    ERROR = auto()          # Error occurred
-    RECOVERING = auto()     # Attempting to recover from error
+class RecordingState(IntEnum):
+    """
+    Recording session states.
+    
+    Values are explicit, contiguous and zero-based: they index rows of the
+    flat transition table.
+    """
+    IDLE = 0           # Ready to start recording
+    MODEL_LOADING = 1  # Loading a transcription model
+    RECORDING = 2      # Actively recording
+    STOPPING = 3       # Transitional state during cleanup
+    FINISHED = 4       # Recording completed successfully
+    ABORTED = 5        # Recording was cancelled
+    ERROR = 6          # Error occurred
+    RECOVERING = 7     # Attempting to recover from error
+
+class RecordingEvent(IntEnum):
+    """
+    Events that can trigger state transitions.
+    
+    Values are explicit, contiguous and zero-based: they index columns of the
+    flat transition table.
+    """
+    START_REQUESTED = 0
+    MODEL_LOAD_REQUESTED = 1
+    MODEL_LOAD_COMPLETED = 2
+    MODEL_LOAD_FAILED = 3
+    STOP_REQUESTED = 4
+    ABORT_REQUESTED = 5
+    SILENCE_DETECTED = 6
+    ERROR_OCCURRED = 7
+    RECOVERY_ATTEMPTED = 8
+    CLEANUP_COMPLETED = 9
+    RECOVERY_SUCCESS = 10
+    RECOVERY_FAILED = 11
+    RESET = 12  # Forced return to IDLE via reset_to_idle(); no table transitions
 
-class RecordingEvent(Enum):
-    """Events that can trigger state transitions."""
-    START_REQUESTED = auto()
-    MODEL_LOAD_REQUESTED = auto()
-    MODEL_LOAD_COMPLETED = auto()
-    MODEL_LOAD_FAILED = auto()
-    STOP_REQUESTED = auto()
-    ABORT_REQUESTED = auto()
-    SILENCE_DETECTED = auto()
-    ERROR_OCCURRED = auto()
-    RECOVERY_ATTEMPTED = auto()
-    CLEANUP_COMPLETED = auto()
-    RECOVERY_SUCCESS = auto()
-    RECOVERY_FAILED = auto()
+# States from which a new recording may be started
+_CAN_START = frozenset({
+    RecordingState.IDLE, RecordingState.FINISHED, RecordingState.ABORTED, RecordingState.ERROR
+})
 
-@dataclass
+# Events that stop a recording normally (user request or detected silence)
+_STOP_EVENTS = frozenset({RecordingEvent.STOP_REQUESTED, RecordingEvent.SILENCE_DETECTED})
+
+# Minimum interval in seconds between invalid-event reports (log + error signal)
+_INVALID_REPORT_INTERVAL = 1.0
+
+# Upper bound on events queued behind the one being handled; protects against
+# cascading handler failures growing the queue without limit
+_MAX_PENDING_EVENTS = 64
+
+@dataclass(frozen=True)
 class StateTransition:
-    """Represents a valid state transition."""
-    from_state: RecordingState
+    """
+    Target of a valid state transition (immutable, no per-instance __dict__).
+    
+    The source state and event are the keys it is stored under in the
+    transition table, so they are not repeated here.
+    """
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = ('to_state', 'description')
+    
     to_state: RecordingState
-    event: RecordingEvent
     description: str
 
-class RecordingStateMachine(QObject):
+# Flattened transition table entry: (to_state, log message, handler)
+TransitionEntry = Tuple[RecordingState, str, Optional[Callable[..., None]]]
+
+class CoreStateMachine:
     """
     Thread-safe recording state machine with event-driven architecture.
     
@@ -56,24 +94,28 @@ class RecordingStateMachine(QObject):
     - Event-driven state changes
     - Thread safety with locks
     - Error handling and recovery
-    - State change notifications
-    """
+    - State change notifications through overridable _notify_* hooks
     
-    # Signals for UI updates
-    state_changed = pyqtSignal(RecordingState, RecordingState, RecordingEvent)
-    error_occurred = pyqtSignal(str)
-    recovery_attempted = pyqtSignal()
+    This class has no Qt dependency and is cheap to construct; use it for
+    headless use and tests. RecordingStateMachine adds the Qt signals.
+    
+    The class deliberately has no __slots__: RecordingStateMachine also
+    derives from QObject, and a slotted base conflicts with QObject's
+    instance layout.
+    """
     
     def __init__(self):
-        super().__init__()
         self.logger = logging.getLogger("w4l.audio.state_machine")
         
-        # State management
-        self._lock = threading.RLock()
+        # State management. The lock only guards the transition decision;
+        # reads of self._state are single reference loads and need no lock.
+        self._lock = threading.Lock()
         self._state = RecordingState.IDLE
         
-        # State transition table
-        self._transitions = self._build_transition_table()
+        # Events raised by handlers while an event is being handled on the same
+        # thread are queued here and processed after the current one, instead
+        # of recursing into handle_event()
+        self._pending = threading.local()
         
         # State handlers
         self._state_handlers = {
@@ -87,6 +129,41 @@ class RecordingStateMachine(QObject):
             RecordingState.RECOVERING: self._handle_recovering,
         }
         
+        # State transition table: flat tuple indexed by (state, event); each
+        # entry carries the target state's handler so one lookup yields both
+        self._n_events = len(RecordingEvent)
+        self._transitions = self._build_transition_table()
+        
+        # Invalid-event messages, indexed like the transition table, so the
+        # invalid path never formats strings
+        self._invalid_msgs = tuple(
+            f"Invalid event {event.name} for state {state.name}"
+            for state in RecordingState for event in RecordingEvent
+        )
+        
+        # Invalid events seen since the last report, by table index; reports
+        # are rate-limited so a misbehaving caller cannot flood log and UI
+        self._invalid_counts = defaultdict(int)
+        self._invalid_last_report = float('-inf')
+        
+        # Names of the events accepted in each state, frozen at build time
+        self._valid_event_names = {
+            state: tuple(event.name for event in self._valid_events(state))
+            for state in RecordingState
+        }
+        
+        # get_state_info() is a pure function of the state: build every answer once
+        self._state_info_cache = {
+            state: MappingProxyType({
+                'state': state.name,
+                'is_recording': state is RecordingState.RECORDING,
+                'can_start': state in _CAN_START,
+                'can_stop': state is RecordingState.RECORDING,
+                'valid_events': self._valid_event_names[state]
+            })
+            for state in RecordingState
+        }
+        
         # Callbacks for external actions
         self.on_start_recording: Optional[Callable[[], None]] = None
         self.on_stop_recording: Optional[Callable[[], None]] = None
@@ -96,163 +173,283 @@ class RecordingStateMachine(QObject):
         
         self.logger.info("Recording state machine initialized")
     
-    def _build_transition_table(self) -> Dict[RecordingState, Dict[RecordingEvent, StateTransition]]:
-        """Build the state transition table."""
+    def _build_transition_table(self) -> Tuple[Optional[TransitionEntry], ...]:
+        """
+        Build the state transition table.
+        
+        The table is a flat tuple with one slot per (state, event) pair, so a
+        lookup is a single index computation instead of two dict lookups.
+        Valid pairs hold (to_state, message, handler) where message is the
+        preformatted transition log line and handler is the target state's
+        handler (or None); invalid pairs hold None.
+        """
         transitions = {}
         
         # IDLE state transitions
         transitions[RecordingState.IDLE] = {
-            RecordingEvent.START_REQUESTED: StateTransition(
-                RecordingState.IDLE, RecordingState.RECORDING, 
-                RecordingEvent.START_REQUESTED, "Start recording"
-            ),
-            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(
-                RecordingState.IDLE, RecordingState.MODEL_LOADING,
-                RecordingEvent.MODEL_LOAD_REQUESTED, "Start model loading"
-            ),
+            RecordingEvent.START_REQUESTED: StateTransition(RecordingState.RECORDING, "Start recording"),
+            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(RecordingState.MODEL_LOADING, "Start model loading"),
         }
         
         # MODEL_LOADING state transitions
         transitions[RecordingState.MODEL_LOADING] = {
-            RecordingEvent.MODEL_LOAD_COMPLETED: StateTransition(
-                RecordingState.MODEL_LOADING, RecordingState.IDLE,
-                RecordingEvent.MODEL_LOAD_COMPLETED, "Model loading completed"
-            ),
-            RecordingEvent.MODEL_LOAD_FAILED: StateTransition(
-                RecordingState.MODEL_LOADING, RecordingState.ERROR,
-                RecordingEvent.MODEL_LOAD_FAILED, "Model loading failed"
-            ),
+            RecordingEvent.MODEL_LOAD_COMPLETED: StateTransition(RecordingState.IDLE, "Model loading completed"),
+            RecordingEvent.MODEL_LOAD_FAILED: StateTransition(RecordingState.ERROR, "Model loading failed"),
         }
         
         # RECORDING state transitions
         transitions[RecordingState.RECORDING] = {
-            RecordingEvent.STOP_REQUESTED: StateTransition(
-                RecordingState.RECORDING, RecordingState.STOPPING,
-                RecordingEvent.STOP_REQUESTED, "Stop recording normally"
-            ),
-            RecordingEvent.ABORT_REQUESTED: StateTransition(
-                RecordingState.RECORDING, RecordingState.ABORTED,
-                RecordingEvent.ABORT_REQUESTED, "Abort recording"
-            ),
-            RecordingEvent.SILENCE_DETECTED: StateTransition(
-                RecordingState.RECORDING, RecordingState.STOPPING,
-                RecordingEvent.SILENCE_DETECTED, "Stop due to silence"
-            ),
-            RecordingEvent.ERROR_OCCURRED: StateTransition(
-                RecordingState.RECORDING, RecordingState.ERROR,
-                RecordingEvent.ERROR_OCCURRED, "Error during recording"
-            ),
+            RecordingEvent.STOP_REQUESTED: StateTransition(RecordingState.STOPPING, "Stop recording normally"),
+            RecordingEvent.ABORT_REQUESTED: StateTransition(RecordingState.ABORTED, "Abort recording"),
+            RecordingEvent.SILENCE_DETECTED: StateTransition(RecordingState.STOPPING, "Stop due to silence"),
+            RecordingEvent.ERROR_OCCURRED: StateTransition(RecordingState.ERROR, "Error during recording"),
         }
         
         # STOPPING state transitions
         transitions[RecordingState.STOPPING] = {
-            RecordingEvent.CLEANUP_COMPLETED: StateTransition(
-                RecordingState.STOPPING, RecordingState.FINISHED,
-                RecordingEvent.CLEANUP_COMPLETED, "Cleanup completed"
-            ),
-            RecordingEvent.ERROR_OCCURRED: StateTransition(
-                RecordingState.STOPPING, RecordingState.ERROR,
-                RecordingEvent.ERROR_OCCURRED, "Error during cleanup"
-            ),
+            RecordingEvent.CLEANUP_COMPLETED: StateTransition(RecordingState.FINISHED, "Cleanup completed"),
+            RecordingEvent.ERROR_OCCURRED: StateTransition(RecordingState.ERROR, "Error during cleanup"),
         }
         
         # FINISHED state transitions
         transitions[RecordingState.FINISHED] = {
-            RecordingEvent.START_REQUESTED: StateTransition(
-                RecordingState.FINISHED, RecordingState.RECORDING,
-                RecordingEvent.START_REQUESTED, "Start new recording"
-            ),
-            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(
-                RecordingState.FINISHED, RecordingState.MODEL_LOADING,
-                RecordingEvent.MODEL_LOAD_REQUESTED, "Start model loading"
-            ),
+            RecordingEvent.START_REQUESTED: StateTransition(RecordingState.RECORDING, "Start new recording"),
+            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(RecordingState.MODEL_LOADING, "Start model loading"),
         }
         
         # ABORTED state transitions
         transitions[RecordingState.ABORTED] = {
-            RecordingEvent.START_REQUESTED: StateTransition(
-                RecordingState.ABORTED, RecordingState.RECORDING,
-                RecordingEvent.START_REQUESTED, "Start new recording"
-            ),
-            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(
-                RecordingState.ABORTED, RecordingState.MODEL_LOADING,
-                RecordingEvent.MODEL_LOAD_REQUESTED, "Start model loading"
-            ),
+            RecordingEvent.START_REQUESTED: StateTransition(RecordingState.RECORDING, "Start new recording"),
+            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(RecordingState.MODEL_LOADING, "Start model loading"),
         }
         
         # ERROR state transitions
         transitions[RecordingState.ERROR] = {
-            RecordingEvent.RECOVERY_ATTEMPTED: StateTransition(
-                RecordingState.ERROR, RecordingState.RECOVERING,
-                RecordingEvent.RECOVERY_ATTEMPTED, "Attempt recovery"
-            ),
-            RecordingEvent.START_REQUESTED: StateTransition(
-                RecordingState.ERROR, RecordingState.RECORDING,
-                RecordingEvent.START_REQUESTED, "Start new recording"
-            ),
-            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(
-                RecordingState.ERROR, RecordingState.MODEL_LOADING,
-                RecordingEvent.MODEL_LOAD_REQUESTED, "Start model loading"
-            ),
+            RecordingEvent.RECOVERY_ATTEMPTED: StateTransition(RecordingState.RECOVERING, "Attempt recovery"),
+            RecordingEvent.START_REQUESTED: StateTransition(RecordingState.RECORDING, "Start new recording"),
+            RecordingEvent.MODEL_LOAD_REQUESTED: StateTransition(RecordingState.MODEL_LOADING, "Start model loading"),
         }
         
         # RECOVERING state transitions
         transitions[RecordingState.RECOVERING] = {
-            RecordingEvent.RECOVERY_SUCCESS: StateTransition(
-                RecordingState.RECOVERING, RecordingState.IDLE,
-                RecordingEvent.RECOVERY_SUCCESS, "Recovery successful"
-            ),
-            RecordingEvent.RECOVERY_FAILED: StateTransition(
-                RecordingState.RECOVERING, RecordingState.ERROR,
-                RecordingEvent.RECOVERY_FAILED, "Recovery failed"
-            ),
+            RecordingEvent.RECOVERY_SUCCESS: StateTransition(RecordingState.IDLE, "Recovery successful"),
+            RecordingEvent.RECOVERY_FAILED: StateTransition(RecordingState.ERROR, "Recovery failed"),
         }
         
-        return transitions
+        table: List[Optional[TransitionEntry]] = [None] * (len(RecordingState) * self._n_events)
+        for from_state, events in transitions.items():
+            for event, transition in events.items():
+                table[self._table_index(from_state, event)] = (
+                    transition.to_state,
+                    f"State transition: {from_state.name} -> "
+                    f"{transition.to_state.name} ({transition.description})",
+                    self._state_handlers.get(transition.to_state),
+                )
+        return tuple(table)
+    
+    def _table_index(self, state: RecordingState, event: RecordingEvent) -> int:
+        """Get the transition table slot for a (state, event) pair."""
+        return state * self._n_events + event
+    
+    def _valid_events(self, state: RecordingState) -> List[RecordingEvent]:
+        """Get the events that have a transition out of a state."""
+        base = state * self._n_events
+        return [event for event in RecordingEvent if self._transitions[base + event]]
+    
+    def _notify_state_changed(self, old_state: RecordingState, new_state: RecordingState,
+                              event: RecordingEvent):
+        """Report a state change (hook; no-op without Qt)."""
+    
+    def _notify_error(self, message: str):
+        """Report an error message (hook; no-op without Qt)."""
+    
+    def _notify_recovery_attempted(self):
+        """Report that recovery is being attempted (hook; no-op without Qt)."""
     
     def get_state(self) -> RecordingState:
-        """Get the current state (thread-safe)."""
+        """
+        Get the current state (lock-free).
+        
+        Reading self._state is a single reference load, so it never sees a
+        torn value. The result may already be stale when a transition is in
+        flight on another thread. That is acceptable for the predicates and
+        UI queries built on it; only transitions take the lock.
+        """
+        return self._state
+    
+    def handle_event(self, event: RecordingEvent, error: Optional[Exception] = None):
+        """
+        Handle an event and transition to the appropriate state.
+        
+        Events are processed iteratively from a per-thread queue: events raised
+        from within a state handler (or a callback it invokes) on the same
+        thread are deferred until the current event has been handled, and a
+        handler failure queues ERROR_OCCURRED ahead of anything else pending.
+        The queue is bounded and consecutive ERROR_OCCURRED events are
+        coalesced into the first one.
+        
+        Args:
+            event: Event to handle
+            error: Exception that caused the event, if any
+        """
+        queue = getattr(self._pending, 'events', None)
+        if queue is not None:
+            # Coalesce back-to-back errors: one ERROR_OCCURRED is enough
+            if event is RecordingEvent.ERROR_OCCURRED and queue and queue[-1][0] is event:
+                self.logger.debug("Dropping duplicate ERROR_OCCURRED (%s)", error)
+                return
+            if len(queue) == _MAX_PENDING_EVENTS:
+                self.logger.warning("Event queue full, dropping %s", queue[0][0].name)
+            queue.append((event, error))
+            return
+        
+        self._pending.events = queue = deque([(event, error)], maxlen=_MAX_PENDING_EVENTS)
+        try:
+            self._drain_pending(queue)
+        finally:
+            self._pending.events = None
+    
+    def handle_events(self, *events: RecordingEvent):
+        """
+        Handle a sequence of events with a single lock acquisition.
+        
+        All transitions are applied in one critical section, so other threads
+        never observe the intermediate states. Notifications and handlers then
+        run in order, outside the lock. Handlers of intermediate states
+        therefore run after the final state is already set; only batch events
+        whose handlers do not depend on reading the current state. Events the
+        handlers raise, including ERROR_OCCURRED for a failed handler, are
+        processed after the whole batch.
+        
+        Called from within a handler, the events are simply queued.
+        
+        Args:
+            events: Events to handle, in order
+        """
+        if getattr(self._pending, 'events', None) is not None:
+            for event in events:
+                self.handle_event(event)
+            return
+        
+        steps = []
         with self._lock:
-            return self._state
+            state = self._state
+            for event in events:
+                index = state * self._n_events + event
+                transition = self._transitions[index]
+                steps.append((state, event, index, transition))
+                if transition:
+                    state = transition[0]
+            self._state = state
+        
+        self._pending.events = queue = deque(maxlen=_MAX_PENDING_EVENTS)
+        try:
+            for old_state, event, index, transition in steps:
+                failure = self._dispatch(old_state, event, index, transition, None)
+                if failure is not None:
+                    self.handle_event(RecordingEvent.ERROR_OCCURRED, failure)
+            self._drain_pending(queue)
+        finally:
+            self._pending.events = None
+    
+    def _drain_pending(self, queue: deque):
+        """Process queued events until the per-thread queue is empty."""
+        while queue:
+            next_event, next_error = queue.popleft()
+            failure = self._process_event(next_event, next_error)
+            if failure is not None:
+                if queue and queue[0][0] is RecordingEvent.ERROR_OCCURRED:
+                    # The handler already reported its failure
+                    continue
+                queue.appendleft((RecordingEvent.ERROR_OCCURRED, failure))
     
-    def handle_event(self, event: RecordingEvent, **kwargs):
-        """Handle an event and transition to the appropriate state."""
+    def _process_event(self, event: RecordingEvent, error: Optional[Exception]) -> Optional[Exception]:
+        """
+        Apply one event: decide the transition under the lock, then notify and run the handler.
+        
+        Returns:
+            The exception raised by the state handler, or None
+        """
         with self._lock:
-            current_state = self._state
-            transition = self._transitions.get(current_state, {}).get(event)
-            
+            old_state = self._state
+            index = old_state * self._n_events + event
+            transition = self._transitions[index]
             if transition:
-                old_state = current_state
-                self._state = transition.to_state
-                
-                self.logger.info(f"State transition: {old_state.name} -> {self._state.name} ({transition.description})")
-                
-                # Emit state change signal
-                self.state_changed.emit(old_state, self._state, event)
-                
-                # Call state handler
-                handler = self._state_handlers.get(self._state)
-                if handler:
-                    try:
-                        handler(event, **kwargs)
-                    except Exception as e:
-                        self.logger.error(f"Error in state handler for {self._state.name}: {e}")
-                        self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
-            else:
-                self.logger.warning(f"Invalid event {event.name} for state {current_state.name}")
-                # Emit error signal for invalid transitions
-                self.error_occurred.emit(f"Invalid event {event.name} for state {current_state.name}")
-    
-    def _handle_idle(self, event: RecordingEvent, **kwargs):
+                self._state = transition[0]
+        
+        return self._dispatch(old_state, event, index, transition, error)
+    
+    def _dispatch(self, old_state: RecordingState, event: RecordingEvent, index: int,
+                  transition: Optional[TransitionEntry],
+                  error: Optional[Exception]) -> Optional[Exception]:
+        """
+        Report an already-applied transition (or invalid event) and run its handler.
+        
+        Returns:
+            The exception raised by the state handler, or None
+        """
+        if not transition:
+            self._report_invalid_event(index)
+            return None
+        
+        new_state, message, handler = transition
+        self.logger.info(message)
+        
+        # Emit state change signal
+        self._notify_state_changed(old_state, new_state, event)
+        
+        # Call state handler
+        if handler:
+            try:
+                handler(event, error)
+            except Exception as e:
+                self.logger.error("Error in state handler for %s: %s", new_state.name, e)
+                return e
+        return None
+    
+    def _report_invalid_event(self, index: int):
+        """
+        Count an invalid (state, event) pair and report it at most once per interval.
+        
+        The first invalid event after a quiet interval is logged and emitted
+        as an error immediately; further ones are only counted and summarized
+        in the next report.
+        
+        Args:
+            index: Transition table index of the rejected pair
+        """
+        counts = self._invalid_counts
+        counts[index] += 1
+        now = time.monotonic()
+        if now - self._invalid_last_report < _INVALID_REPORT_INTERVAL:
+            return
+        
+        message = self._invalid_msgs[index]
+        suppressed = sum(counts.values()) - 1
+        if suppressed:
+            self.logger.warning(
+                "%s (%d more invalid events since last report: %s)",
+                message, suppressed,
+                {self._invalid_msgs[i]: n for i, n in counts.items()}
+            )
+        else:
+            self.logger.warning(message)
+        counts.clear()
+        self._invalid_last_report = now
+        
+        # Emit error signal for invalid transitions
+        self._notify_error(message)
+    
+    def _handle_idle(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle IDLE state."""
         if event == RecordingEvent.START_REQUESTED and self.on_start_recording:
             try:
                 self.on_start_recording()
             except Exception as e:
-                self.logger.error(f"Error starting recording: {e}")
-                self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
+                self.logger.error("Error starting recording: %s", e)
+                self.handle_event(RecordingEvent.ERROR_OCCURRED, e)
     
-    def _handle_model_loading(self, event: RecordingEvent, **kwargs):
+    def _handle_model_loading(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle MODEL_LOADING state."""
         # This handler is called when entering MODEL_LOADING state
         if event == RecordingEvent.MODEL_LOAD_REQUESTED:
@@ -260,119 +457,199 @@ class RecordingStateMachine(QObject):
             # The actual model loading is handled by the main window
             # This handler just logs the state change
     
-    def _handle_recording(self, event: RecordingEvent, **kwargs):
+    def _handle_recording(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle RECORDING state."""
         # This handler is called when entering RECORDING state
         if event == RecordingEvent.START_REQUESTED and self.on_start_recording:
             try:
                 self.on_start_recording()
             except Exception as e:
-                self.logger.error(f"Error starting recording: {e}")
-                self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
+                self.logger.error("Error starting recording: %s", e)
+                self.handle_event(RecordingEvent.ERROR_OCCURRED, e)
     
-    def _handle_stopping(self, event: RecordingEvent, **kwargs):
+    def _handle_stopping(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle STOPPING state."""
-        self.logger.info(f"_handle_stopping: Entering STOPPING state with event {event.name}")
         # This handler is called when entering STOPPING state
-        if event == RecordingEvent.STOP_REQUESTED and self.on_stop_recording:
-            try:
-                self.logger.info("_handle_stopping: Calling on_stop_recording callback")
-                self.on_stop_recording()
-                self.logger.info("_handle_stopping: on_stop_recording callback completed")
-                # Don't call handle_event here - let the callback do it
-            except Exception as e:
-                self.logger.error(f"Error stopping recording: {e}")
-                self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
-        elif event == RecordingEvent.SILENCE_DETECTED and self.on_stop_recording:
+        if event in _STOP_EVENTS and self.on_stop_recording:
+            self.logger.debug("_handle_stopping: Calling on_stop_recording callback (%s)", event.name)
             try:
-                self.logger.info("_handle_stopping: Calling on_stop_recording callback (silence detected)")
                 self.on_stop_recording()
-                self.logger.info("_handle_stopping: on_stop_recording callback completed (silence detected)")
                 # Don't call handle_event here - let the callback do it
             except Exception as e:
-                self.logger.error(f"Error stopping recording due to silence: {e}")
-                self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
+                self.logger.error("Error stopping recording (%s): %s", event.name, e)
+                self.handle_event(RecordingEvent.ERROR_OCCURRED, e)
         else:
-            self.logger.warning(f"_handle_stopping: No on_stop_recording callback or unexpected event {event.name}")
+            self.logger.warning("_handle_stopping: No on_stop_recording callback or unexpected event %s", event.name)
     
-    def _handle_finished(self, event: RecordingEvent, **kwargs):
+    def _handle_finished(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle FINISHED state."""
-        self.logger.info(f"_handle_finished: Entering FINISHED state with event {event.name}")
+        self.logger.debug("_handle_finished: Entering FINISHED state with event %s", event.name)
         # Recording completed successfully
         self.logger.info("Recording completed successfully")
     
-    def _handle_aborted(self, event: RecordingEvent, **kwargs):
+    def _handle_aborted(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle ABORTED state."""
         # This handler is called when entering ABORTED state
         if event == RecordingEvent.ABORT_REQUESTED and self.on_abort_recording:
             try:
                 self.on_abort_recording()
             except Exception as e:
-                self.logger.error(f"Error aborting recording: {e}")
-                self.handle_event(RecordingEvent.ERROR_OCCURRED, error=e)
+                self.logger.error("Error aborting recording: %s", e)
+                self.handle_event(RecordingEvent.ERROR_OCCURRED, e)
     
-    def _handle_error(self, event: RecordingEvent, **kwargs):
+    def _handle_error(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle ERROR state."""
-        error = kwargs.get('error')
         if error:
-            self.logger.error(f"Recording error: {error}")
-            self.error_occurred.emit(str(error))
+            self.logger.error("Recording error: %s", error)
+            self._notify_error(str(error))
             if self.on_error:
                 try:
                     self.on_error(error)
                 except Exception as e:
-                    self.logger.error(f"Error in error handler: {e}")
+                    self.logger.error("Error in error handler: %s", e)
     
-    def _handle_recovering(self, event: RecordingEvent, **kwargs):
+    def _handle_recovering(self, event: RecordingEvent, error: Optional[Exception] = None):
         """Handle RECOVERING state."""
         self.logger.info("Attempting to recover from error")
-        self.recovery_attempted.emit()
+        self._notify_recovery_attempted()
         
         if self.on_recovery:
             try:
                 self.on_recovery()
                 self.handle_event(RecordingEvent.RECOVERY_SUCCESS)
             except Exception as e:
-                self.logger.error(f"Recovery failed: {e}")
-                self.handle_event(RecordingEvent.RECOVERY_FAILED, error=e)
+                self.logger.error("Recovery failed: %s", e)
+                self.handle_event(RecordingEvent.RECOVERY_FAILED, e)
     
     def _handle_internal_error(self, error: Exception):
         """Handle internal state machine errors."""
-        self.logger.error(f"Internal state machine error: {error}")
+        self.logger.error("Internal state machine error: %s", error)
         # Force transition to error state
         with self._lock:
             old_state = self._state
             self._state = RecordingState.ERROR
-            self.state_changed.emit(old_state, self._state, RecordingEvent.ERROR_OCCURRED)
+        self._notify_state_changed(old_state, RecordingState.ERROR, RecordingEvent.ERROR_OCCURRED)
     
     def reset_to_idle(self):
-        """Reset the state machine to IDLE state."""
+        """
+        Reset the state machine to IDLE state.
+        
+        Does nothing if already IDLE. Listeners see the change as a RESET event.
+        """
+        if self._state is RecordingState.IDLE:
+            return
+        
         with self._lock:
             old_state = self._state
+            if old_state is RecordingState.IDLE:
+                return
             self._state = RecordingState.IDLE
-            self.logger.info(f"State machine reset: {old_state.name} -> IDLE")
-            self.state_changed.emit(old_state, self._state, RecordingEvent.START_REQUESTED)
+        self.logger.info("State machine reset: %s -> IDLE", old_state.name)
+        self._notify_state_changed(old_state, RecordingState.IDLE, RecordingEvent.RESET)
     
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self.get_state() == RecordingState.RECORDING
+        return self._state is RecordingState.RECORDING
     
     def can_start_recording(self) -> bool:
         """Check if recording can be started."""
-        state = self.get_state()
-        return state in [RecordingState.IDLE, RecordingState.FINISHED, RecordingState.ABORTED, RecordingState.ERROR]
+        return self._state in _CAN_START
     
     def can_stop_recording(self) -> bool:
         """Check if recording can be stopped."""
-        return self.get_state() == RecordingState.RECORDING
-    
-    def get_state_info(self) -> Dict[str, Any]:
-        """Get detailed information about the current state."""
-        state = self.get_state()
-        return {
-            'state': state.name,
-            'is_recording': self.is_recording(),
-            'can_start': self.can_start_recording(),
-            'can_stop': self.can_stop_recording(),
-            'valid_events': [event.name for event in self._transitions.get(state, {}).keys()]
-        } 
\ No newline at end of file
+        return self._state is RecordingState.RECORDING
+    
+    def get_state_info(self) -> Mapping[str, Any]:
+        """
+        Get detailed information about the current state.
+        
+        Returns:
+            Read-only mapping precomputed for the current state (shared between callers)
+        """
+        return self._state_info_cache[self.get_state()] 
+
+
+class RecordingStateMachine(CoreStateMachine, QObject):
+    """
+    Recording state machine that reports changes through Qt signals.
+    
+    state_changed is emitted synchronously for every transition, on the
+    thread that handled the event. state_settled is meant for UI updates:
+    it is delivered on this object's thread through the event loop, and a
+    burst of transitions that happens before the loop gets to it is
+    coalesced into one emit from the first old state to the latest state.
+    """
+    
+    # Signals for UI updates
+    state_changed = pyqtSignal(RecordingState, RecordingState, RecordingEvent)
+    state_settled = pyqtSignal(RecordingState, RecordingState, RecordingEvent)
+    error_occurred = pyqtSignal(str)
+    recovery_attempted = pyqtSignal()
+    
+    # Internal: asks the event loop to flush the pending state_settled emit
+    _settle_requested = pyqtSignal()
+    
+    def __init__(self):
+        QObject.__init__(self)
+        
+        # Whether anything listens to state_changed / state_settled; kept
+        # current by connectNotify()/disconnectNotify() so emits can be
+        # skipped cheaply
+        self._state_changed_has_receivers = False
+        self._state_settled_has_receivers = False
+        
+        # Coalesced (old_state, new_state, event) waiting for the event loop
+        self._settled_lock = threading.Lock()
+        self._settled_pending: Optional[Tuple[RecordingState, RecordingState, RecordingEvent]] = None
+        self._settle_requested.connect(self._flush_state_settled,
+                                       Qt.ConnectionType.QueuedConnection)
+        
+        CoreStateMachine.__init__(self)
+    
+    def connectNotify(self, signal):
+        """Track whether the state signals have receivers (Qt override)."""
+        super().connectNotify(signal)
+        self._update_receivers()
+    
+    def disconnectNotify(self, signal):
+        """Track whether the state signals have receivers (Qt override)."""
+        super().disconnectNotify(signal)
+        self._update_receivers()
+    
+    def _update_receivers(self):
+        """Refresh the cached receiver flags."""
+        self._state_changed_has_receivers = self.receivers(self.state_changed) > 0
+        self._state_settled_has_receivers = self.receivers(self.state_settled) > 0
+    
+    def _notify_state_changed(self, old_state: RecordingState, new_state: RecordingState,
+                              event: RecordingEvent):
+        """Emit state_changed and queue state_settled, skipping signals nobody listens to."""
+        if old_state is new_state:
+            return
+        if self._state_changed_has_receivers:
+            self.state_changed.emit(old_state, new_state, event)
+        if self._state_settled_has_receivers:
+            with self._settled_lock:
+                pending = self._settled_pending
+                if pending is not None:
+                    # A flush is already queued: just fold this change into it
+                    self._settled_pending = (pending[0], new_state, event)
+                    return
+                self._settled_pending = (old_state, new_state, event)
+            self._settle_requested.emit()
+    
+    def _flush_state_settled(self):
+        """Emit the coalesced state_settled (runs on this object's thread)."""
+        with self._settled_lock:
+            pending = self._settled_pending
+            self._settled_pending = None
+        if pending is not None:
+            self.state_settled.emit(*pending)
+    
+    def _notify_error(self, message: str):
+        """Emit error_occurred."""
+        self.error_occurred.emit(message)
+    
+    def _notify_recovery_attempted(self):
+        """Emit recovery_attempted."""
+        self.recovery_attempted.emit()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Pre-allocated ring buffers and buffer pools for handing audio between threads.
+
+The real-time PortAudio callback must not allocate or block, so audio blocks
+are copied into fixed slots of a single pre-allocated array and picked up by a
+consumer thread that does the actual processing.
+"""
+
+import numpy as np
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+# Cache-line / AVX-512 vector width in bytes
+SIMD_ALIGNMENT = 64
+
+
+def aligned_empty(shape, dtype=np.float32, alignment: int = SIMD_ALIGNMENT) -> np.ndarray:
+    """
+    Allocate an uninitialized C-contiguous array whose data starts on an
+    `alignment`-byte boundary.
+
+    np.empty only guarantees 16-byte alignment; aligned buffers let NumPy's
+    (and numba's) vectorized loops use aligned SIMD loads and stores.
+
+    Args:
+        shape: Array shape
+        dtype: Array data type
+        alignment: Required alignment of the first element in bytes
+
+    Returns:
+        Aligned array of the requested shape and dtype
+    """
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape))
+    raw = np.empty(count * dtype.itemsize + alignment, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % alignment
+    return np.frombuffer(raw, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+
+class BlockRingBuffer:
+    """
+    Single-producer/single-consumer ring buffer of fixed-size audio blocks.
+
+    The producer (the stream callback) only ever advances ``_head`` and the
+    consumer (the recorder worker thread) only ever advances ``_tail``. Since
+    each index has exactly one writer and integer attribute stores are atomic
+    under the GIL, neither side needs a lock.
+    """
+
+    def __init__(self, capacity: int, blocksize: int, channels: int, dtype=np.int16):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of block slots in the ring
+            blocksize: Maximum number of frames per block
+            channels: Number of audio channels per frame
+            dtype: Sample data type
+        """
+        self.capacity = capacity
+        self.blocksize = blocksize
+        self.channels = channels
+
+        # All block storage is allocated once, up front
+        self._slots = aligned_empty((capacity, blocksize, channels), dtype=dtype)
+        self._frames = [0] * capacity
+
+        # Monotonic write/read counters; slot index is counter % capacity
+        self._head = 0
+        self._tail = 0
+
+        # Blocks rejected because the consumer fell behind
+        self.dropped_blocks = 0
+
+    def push(self, block: np.ndarray) -> bool:
+        """
+        Copy a block into the next free slot (producer side).
+
+        Args:
+            block: Audio block of shape (frames, channels)
+
+        Returns:
+            True if the block was stored, False if the ring was full
+        """
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped_blocks += 1
+            return False
+
+        slot = head % self.capacity
+        frames = block.shape[0]
+        np.copyto(self._slots[slot, :frames], block)
+        self._frames[slot] = frames
+
+        # Publish the slot only after it has been filled
+        self._head = head + 1
+        return True
+
+    def peek(self) -> Optional[np.ndarray]:
+        """
+        Get the oldest unread block without releasing its slot (consumer side).
+
+        The returned array is a view into the ring. It stays valid until
+        ``advance()`` is called; copy it if it needs to outlive that.
+
+        Returns:
+            View of the oldest block, or None if the ring is empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+
+        slot = tail % self.capacity
+        return self._slots[slot, :self._frames[slot]]
+
+    def advance(self) -> None:
+        """Release the block returned by ``peek()`` (consumer side)."""
+        if self._tail != self._head:
+            self._tail += 1
+
+    def reset(self) -> None:
+        """Discard all blocks. Only call while neither side is running."""
+        self._head = 0
+        self._tail = 0
+        self.dropped_blocks = 0
+
+    def __len__(self) -> int:
+        """Number of blocks waiting to be consumed."""
+        return self._head - self._tail
+
+
+class SampleRingBuffer:
+    """
+    Fixed-capacity ring of the most recent mono samples.
+
+    Writes overwrite the oldest samples once the ring is full. Reads that fall
+    across the wrap-around point are linearized into a pre-allocated scratch
+    buffer instead of allocating a new array on every call.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """
+        Initialize the sample ring.
+
+        Args:
+            capacity: Maximum number of samples kept
+            dtype: Sample data type
+        """
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._linear = np.empty(capacity, dtype=dtype)
+
+        # Next write position and number of valid samples
+        self._head = 0
+        self._len = 0
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        Append samples, overwriting the oldest ones when full.
+
+        Args:
+            samples: Samples to append (flattened if multi-dimensional)
+        """
+        samples = samples.reshape(-1)
+        count = samples.shape[0]
+        if count == 0:
+            return
+        if count >= self.capacity:
+            # Only the newest `capacity` samples survive
+            samples = samples[-self.capacity:]
+            count = self.capacity
+
+        head = self._head
+        first = min(count, self.capacity - head)
+        self._data[head:head + first] = samples[:first]
+        if first < count:
+            self._data[:count - first] = samples[first:]
+
+        self._head = (head + count) % self.capacity
+        self._len = min(self._len + count, self.capacity)
+
+    def append(self, value) -> None:
+        """
+        Append a single sample, overwriting the oldest one when full.
+
+        Cheaper than write() for scalars such as per-window levels.
+
+        Args:
+            value: Sample value
+        """
+        head = self._head
+        self._data[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._len < self.capacity:
+            self._len += 1
+
+    def latest(self, count: Optional[int] = None,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copy the most recent samples, in chronological order, into a buffer.
+
+        Args:
+            count: Number of samples to return (default: all buffered samples)
+            out: Pre-allocated destination of at least `count` samples
+                 (default: the ring's own linearization buffer)
+
+        Returns:
+            View of `out` holding up to `count` samples, oldest first. When the
+            ring's own buffer is used it stays valid until the next read.
+        """
+        if out is None:
+            out = self._linear
+
+        length = self._len
+        if count is None or count > length:
+            count = length
+
+        start = (self._head - count) % self.capacity
+        first = min(count, self.capacity - start)
+        out[:first] = self._data[start:start + first]
+        if first < count:
+            # Wrapped: stitch the older tail and the newer head together
+            out[first:count] = self._data[:count - first]
+        return out[:count]
+
+    def clear(self) -> None:
+        """Discard all buffered samples."""
+        self._head = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Number of buffered samples."""
+        return self._len
+
+
+class BufferPool:
+    """
+    Free list of pre-allocated, equally shaped block buffers.
+
+    Producers ``acquire()`` a buffer, fill it and pass it downstream; the
+    consumer ``release()``s it once done, so steady-state streaming never
+    allocates. ``deque.append``/``popleft`` are atomic in CPython, so acquire
+    and release may happen on different threads without a lock.
+    """
+
+    def __init__(self, pool_size: int, shape: Tuple[int, ...], dtype=np.int16):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Number of buffers to pre-allocate
+            shape: Shape of each buffer, e.g. (blocksize, channels)
+            dtype: Buffer data type
+        """
+        self.pool_size = pool_size
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._free = deque(np.empty(self.shape, dtype=self.dtype) for _ in range(pool_size))
+
+        # Acquisitions served by a fresh allocation because the pool was empty
+        self.misses = 0
+
+    def acquire(self) -> np.ndarray:
+        """
+        Take a buffer from the pool.
+
+        Falls back to allocating a new buffer if the consumer has fallen behind
+        and the pool is empty; such buffers join the pool on release.
+
+        Returns:
+            Buffer of the pool's shape and dtype (contents undefined)
+        """
+        try:
+            return self._free.popleft()
+        except IndexError:
+            self.misses += 1
+            return np.empty(self.shape, dtype=self.dtype)
+
+    def release(self, buf: np.ndarray) -> None:
+        """
+        Return a buffer obtained from ``acquire()`` to the pool.
+
+        Args:
+            buf: Buffer to return; foreign shapes/dtypes are ignored
+        """
+        if buf.shape == self.shape and buf.dtype == self.dtype and len(self._free) < self.pool_size:
+            self._free.append(buf)
+
+    @contextmanager
+    def borrowed(self) -> Iterator[np.ndarray]:
+        """Context manager that acquires a buffer and releases it on exit."""
+        buf = self.acquire()
+        try:
+            yield buf
+        finally:
+            self.release(buf)
+
+    def __len__(self) -> int:
+        """Number of buffers currently available."""
+        return len(self._free)
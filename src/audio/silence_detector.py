@@ -12,13 +12,24 @@ constant background noise like laptop fans by implementing:
 
 import numpy as np
 import logging
+import math
 import time
 import threading
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from collections import deque
 
+from .ring_buffer import SampleRingBuffer, aligned_empty
+from .block_kernels import int16_envelope
+
+# Full-scale value of 16-bit samples; int16 levels are divided by this (or its
+# square) once per window instead of converting every sample to float
+INT16_FULL_SCALE = 32767.0
+
+# Sample rate the detector's durations are measured in
+SAMPLE_RATE = 16000
+
 class DetectionStrategy(Enum):
     """Silence detection strategies."""
     RMS = "rms"                    # Root Mean Square energy
@@ -76,24 +87,51 @@ class SilenceDetector:
         self.is_learning = True
         self.speech_detected = False
         self.last_speech_time = 0.0
-        self.silence_start_time = 0.0
         
-        # Audio analysis buffers
-        self.audio_buffer = deque(maxlen=int(self.config.window_size * 2))
-        self.rms_history = deque(maxlen=100)  # RMS values for adaptation
-        self.spectral_history = deque(maxlen=100)  # Spectral values for adaptation
+        # Silence is timed in analyzed audio samples rather than wall-clock
+        # time, so it is immune to clock jumps and analysis-thread stalls
+        self._audio_clock = 0
+        self._silence_start_sample = -1
+        
+        # Set once on_silence_detected has fired for the current session;
+        # is_active stays owned by start()/stop()
+        self._silence_fired = False
         
-        # Adaptive noise floor
+        # Recent per-window levels for adaptation, kept as float32 rings so
+        # statistics run on contiguous arrays instead of boxed floats
+        self.rms_history = SampleRingBuffer(100, dtype=np.float32)
+        self.spectral_history = SampleRingBuffer(100, dtype=np.float32)
+        
+        # Per-block int16 energy envelopes (peak, sum of squares, frames), used
+        # instead of raw samples by strategies that only need signal energy
+        self.envelope_buffer = deque(maxlen=64)
+        self.peak_level = 0.0
+        
+        # Adaptive noise floor; learning is measured in audio frames so it
+        # lasts noise_learning_duration however the audio is chunked
         self.learned_noise_floor = 0.0
         self.adaptive_threshold = 0.0
         self.noise_samples = 0
-        self.min_noise_samples = int(self.config.noise_learning_duration * 16000 / self.config.hop_size)
+        self.noise_frames = 0
+        
+        # Configuration snapshot used by the analysis path, plus the audio
+        # analysis buffers sized for it
+        self._ws = 0
+        self._freeze_config()
         
         # Thread safety
         self._lock = threading.Lock()
         self._analysis_thread: Optional[threading.Thread] = None
         self._stop_analysis = threading.Event()
         
+        # Producers wake the analysis thread once a hop of new audio (or a new
+        # envelope) is available. Sample positions are monotonic counters with
+        # a single writer each: producers advance _samples_written, the
+        # analysis thread advances _samples_analyzed.
+        self._data_ready = threading.Event()
+        self._samples_written = 0
+        self._samples_analyzed = 0
+        
         # Callbacks
         self.on_silence_detected: Optional[Callable[[], None]] = None
         self.on_speech_detected: Optional[Callable[[], None]] = None
@@ -106,6 +144,55 @@ class SilenceDetector:
         
         self.logger.info("Silence detector initialized")
     
+    def _freeze_config(self) -> None:
+        """
+        Snapshot the configuration into plain attributes for the analysis path.
+        
+        The analysis thread reads only these snapshots, never self.config, so
+        the per-window path has no attribute chains. Buffers are reallocated
+        if the window size changed. Called from __init__, start() and
+        update_config().
+        """
+        config = self.config
+        window_size = int(config.window_size)
+        self._hop = int(config.hop_size)
+        self._fft_n = int(config.fft_size)
+        self._alpha = config.adaptation_rate
+        self._noise_margin = config.noise_margin
+        self._envelope_mode = self._strategy_uses_envelope(config)
+        self._noise_learning_frames = int(config.noise_learning_duration * SAMPLE_RATE)
+        
+        if window_size != self._ws:
+            self._ws = window_size
+            self._allocate_sample_buffers()
+        self._configure_speech_band()
+        
+        # Detection function and thresholds for the configured strategy
+        self._configure_detection()
+    
+    def _allocate_sample_buffers(self) -> None:
+        """Allocate the sample ring and analysis window for the current window size."""
+        window_size = self._ws
+        self.audio_buffer = SampleRingBuffer(window_size * 2, dtype=np.int16)
+        self._window_scratch = aligned_empty(window_size, dtype=np.int16)
+        self._sq_scratch = aligned_empty((window_size, 1), dtype=np.int32)
+        
+        # Spectral analysis: the Hann window only depends on the window size,
+        # so it is computed once and applied into a float32 scratch buffer
+        self._hann = np.hanning(window_size).astype(np.float32)
+        self._windowed_scratch = aligned_empty(window_size, dtype=np.float32)
+    
+    def _configure_speech_band(self) -> None:
+        """
+        Compute the rfft bin range used for spectral energy.
+        
+        Skips DC and the first bin and keeps the lowest tenth of the remaining
+        positive frequencies (the speech band).
+        """
+        positive_bins = self._fft_n // 2 - 1
+        self._band_lo = 2
+        self._band_hi = 1 + positive_bins // 10
+    
     def start(self) -> None:
         """Start the silence detector."""
         with self._lock:
@@ -113,24 +200,34 @@ class SilenceDetector:
                 self.logger.warning("Silence detector already active")
                 return
             
+            # Pick up any in-place edits to self.config since the last session
+            self._freeze_config()
+            
             self.is_active = True
             self.is_learning = True
             self.speech_detected = False
-            self.silence_start_time = 0.0
+            self._silence_fired = False
             self.last_speech_time = 0.0
+            self._audio_clock = 0
+            self._silence_start_sample = -1
             
             # Reset adaptive parameters
             self.learned_noise_floor = 0.0
             self.adaptive_threshold = 0.0
             self.noise_samples = 0
+            self.noise_frames = 0
             
             # Clear buffers
             self.audio_buffer.clear()
+            self.envelope_buffer.clear()
             self.rms_history.clear()
             self.spectral_history.clear()
+            self._samples_written = 0
+            self._samples_analyzed = 0
             
             # Start analysis thread
             self._stop_analysis.clear()
+            self._data_ready.clear()
             self._analysis_thread = threading.Thread(target=self._analysis_loop, daemon=True)
             self._analysis_thread.start()
             
@@ -144,134 +241,275 @@ class SilenceDetector:
             
             self.is_active = False
             self._stop_analysis.set()
+            self._data_ready.set()  # wake the analysis thread so it can exit
             
-            if self._analysis_thread and self._analysis_thread.is_alive():
+            # stop() may be called from a callback on the analysis thread itself
+            if (self._analysis_thread and self._analysis_thread.is_alive()
+                    and self._analysis_thread is not threading.current_thread()):
                 self._analysis_thread.join(timeout=2.0)
             
             self.logger.info("Silence detector stopped")
     
+    def wants_samples(self) -> bool:
+        """
+        Check whether the detector currently consumes raw int16 samples.
+        
+        Samples are always kept while active, since get_audio_buffer() serves
+        the recording for transcription. Producers use this to skip feeding
+        the detector entirely while it is inactive or shutting down.
+        """
+        return self.is_active and not self._stop_analysis.is_set()
+    
+    def wants_envelope(self) -> bool:
+        """
+        Check whether the detector currently analyzes per-block energy envelopes.
+        
+        True for strategies that never look at the spectrum (RMS, ADAPTIVE).
+        Producers then call add_envelope() in addition to passing the samples,
+        and the detector skips its own windowed analysis.
+        """
+        return (self.is_active and not self._stop_analysis.is_set()
+                and self._envelope_mode)
+    
+    @staticmethod
+    def _strategy_uses_envelope(config: SilenceConfig) -> bool:
+        """Check whether a configuration can be served by energy envelopes alone."""
+        return config.primary_strategy in (DetectionStrategy.RMS, DetectionStrategy.ADAPTIVE)
+    
+    def add_envelope(self, peak: int, sum_sq: int, frames: int) -> None:
+        """
+        Add a per-block energy envelope computed on int16 samples.
+        
+        Args:
+            peak: Absolute peak sample value of the block
+            sum_sq: Sum of squared sample values of the block
+            frames: Number of samples the envelope covers
+        """
+        if not self.is_active or frames <= 0:
+            return
+        
+        self.envelope_buffer.append((peak, sum_sq, frames))
+        self._data_ready.set()
+    
     def add_audio_data(self, audio_chunk: np.ndarray) -> None:
         """
-        Add audio data for analysis.
+        Add float audio data for analysis.
+        
+        Args:
+            audio_chunk: Audio data as numpy array, normalized to [-1, 1]
+        """
+        if not self.is_active:
+            return
+        
+        scaled = np.clip(audio_chunk * INT16_FULL_SCALE, -32768, 32767)
+        self._write_samples(scaled.astype(np.int16))
+    
+    def add_audio_data_int16(self, audio_chunk: np.ndarray) -> None:
+        """
+        Add int16 audio data for analysis without any float conversion.
         
         Args:
-            audio_chunk: Audio data as numpy array
+            audio_chunk: int16 audio data as numpy array
         """
         if not self.is_active:
             return
         
-        # Add to buffer
-        for sample in audio_chunk.flatten():
-            self.audio_buffer.append(sample)
+        self._write_samples(audio_chunk)
+    
+    def _write_samples(self, samples: np.ndarray) -> None:
+        """
+        Append int16 samples to the ring and wake the analysis thread once a
+        full hop of new samples is available.
+        
+        Args:
+            samples: int16 audio data
+        """
+        self.audio_buffer.write(samples)
+        written = self._samples_written + samples.size
+        self._samples_written = written
+        
+        # In envelope mode add_envelope() wakes the analysis thread instead
+        if (not self._envelope_mode
+                and written - self._samples_analyzed >= self._hop
+                and not self._data_ready.is_set()):
+            self._data_ready.set()
+    
+    def get_audio_buffer(self) -> Optional[np.ndarray]:
+        """
+        Get the buffered int16 audio samples in chronological order.
+        
+        Returns:
+            View of the ring's linearization buffer (valid until the next call),
+            or None if no audio is buffered
+        """
+        if len(self.audio_buffer) == 0:
+            return None
+        return self.audio_buffer.latest()
     
     def _analysis_loop(self) -> None:
-        """Main analysis loop running in separate thread."""
+        """
+        Main analysis loop running in separate thread.
+        
+        Sleeps until a producer signals new data instead of polling, and
+        analyzes each hop of new samples once.
+        """
         while self.is_active and not self._stop_analysis.is_set():
             try:
-                if len(self.audio_buffer) >= self.config.window_size:
+                # The timeout only bounds how long a missed wake-up can delay us
+                self._data_ready.wait(timeout=0.1)
+                self._data_ready.clear()
+                
+                if self._envelope_mode:
+                    while self.envelope_buffer:
+                        self._analyze_envelope(*self.envelope_buffer.popleft())
+                    continue
+                
+                pending = self._samples_written - self._samples_analyzed
+                if pending >= self._hop and len(self.audio_buffer) >= self._ws:
+                    # Consume whole hops only; a partial hop carries over to
+                    # the next analysis. A backlog of several hops is analyzed
+                    # as one window, so the levels stand for every frame
+                    # consumed here.
+                    consumed = pending - pending % self._hop
+                    self._audio_clock += consumed
+                    self._samples_analyzed += consumed
+                    
                     # Extract window for analysis
-                    window = np.array(list(self.audio_buffer)[-self.config.window_size:])
+                    window = self.audio_buffer.latest(self._ws, self._window_scratch)
                     
                     # Perform analysis
-                    self._analyze_window(window)
-                
-                # Sleep to control analysis rate
-                time.sleep(0.01)  # 100Hz analysis rate
+                    self._analyze_window(window, consumed)
                 
             except Exception as e:
-                self.logger.error(f"Error in analysis loop: {e}")
-                time.sleep(0.1)  # Longer sleep on error
+                self.logger.error("Error in analysis loop: %s", e)
+                time.sleep(0.1)  # Back off on error
     
-    def _analyze_window(self, window: np.ndarray) -> None:
+    def _analyze_window(self, window: np.ndarray, frames: int) -> None:
         """
         Analyze a window of audio data.
         
+        Levels are computed on the int16 samples and rescaled to [0, 1] as
+        scalars, so the window is never converted to float.
+        
         Args:
-            window: Audio window to analyze
+            window: int16 audio window to analyze
+            frames: Number of new audio frames since the previous analysis
         """
-        rms_value = self._calculate_rms(window)
-        spectral_value = self._calculate_spectral_energy(window)
+        peak, sum_sq = int16_envelope(window.reshape(-1, 1), self._sq_scratch[:len(window)])
+        self.peak_level = peak / INT16_FULL_SCALE
+        rms_value, energy_value = self._rms_and_energy(sum_sq, len(window))
+        spectral_value = self._calculate_spectral_energy(window) / (INT16_FULL_SCALE * INT16_FULL_SCALE)
+        self._process_levels(rms_value, spectral_value, energy_value, frames)
+    
+    def _analyze_envelope(self, peak: int, sum_sq: int, frames: int) -> None:
+        """
+        Analyze an int16 energy envelope of one audio block.
+        
+        Args:
+            peak: Absolute peak sample value of the block
+            sum_sq: Sum of squared sample values of the block
+            frames: Number of samples the envelope covers
+        """
+        self._audio_clock += frames
+        self.peak_level = peak / INT16_FULL_SCALE
+        rms_value, energy_value = self._rms_and_energy(sum_sq, frames)
+        # Envelope strategies never consult the spectrum
+        self._process_levels(rms_value, 0.0, energy_value, frames)
+    
+    @staticmethod
+    def _rms_and_energy(sum_sq: int, frames: int) -> Tuple[float, float]:
+        """
+        Derive RMS level and mean energy from one int16 sum of squares.
+        
+        Energy (mean square) and RMS come from the same pass over the samples;
+        RMS is just its square root.
         
+        Args:
+            sum_sq: Sum of squared int16 sample values
+            frames: Number of samples summed
+            
+        Returns:
+            (rms, energy) normalized to full scale
+        """
+        energy = sum_sq / (frames * INT16_FULL_SCALE * INT16_FULL_SCALE)
+        return math.sqrt(energy), energy
+    
+    def _process_levels(self, rms_value: float, spectral_value: float, energy_value: float,
+                        frames: int) -> None:
+        """
+        Run noise learning and speech/silence detection on analyzed levels.
+        
+        Args:
+            rms_value: RMS level normalized to [0, 1]
+            spectral_value: Spectral energy in the speech band
+            energy_value: Mean energy (mean square) normalized to [0, 1]
+            frames: Number of new audio frames the levels stand for
+        """
         self.rms_history.append(rms_value)
         self.spectral_history.append(spectral_value)
         
-        current_time = time.time()
-
         if self.is_learning:
-            self._update_noise_floor(rms_value, spectral_value)
-            if self.noise_samples >= self.min_noise_samples:
+            self._update_noise_floor(rms_value, spectral_value, frames)
+            if self.noise_frames >= self._noise_learning_frames:
                 self._finalize_noise_learning()
                 self.is_learning = False  # Transition out of learning state
-                self.silence_start_time = current_time
+                self._silence_start_sample = self._audio_clock
             return
 
-        is_speech = self._detect_speech(rms_value, spectral_value, 0)
+        is_speech = self._detect_fn(rms_value, spectral_value, energy_value)
         
         if is_speech:
-            self.silence_start_time = 0.0
+            self._silence_start_sample = -1
             if not self.speech_detected:
                 self.speech_detected = True
-                self.last_speech_time = current_time
+                self.last_speech_time = time.monotonic()
                 if self.on_speech_detected:
                     try:
                         self.on_speech_detected()
                     except Exception as e:
-                        self.logger.error(f"Error in speech detected callback: {e}")
+                        self.logger.error("Error in speech detected callback: %s", e)
         else:
-            if self.silence_start_time == 0.0:
-                self.silence_start_time = current_time
+            if self._silence_start_sample < 0:
+                self._silence_start_sample = self._audio_clock
             
-            if (current_time - self.silence_start_time) >= self.config.silence_duration:
-                # A lock is needed here to prevent a race condition where the callback
-                # is fired multiple times before the stream is stopped.
+            if (self._audio_clock - self._silence_start_sample >= self._silence_samples
+                    and not self._silence_fired):
+                # Test-and-set under the lock so the callback fires only once
+                # per session, even if stop() races with this thread
                 with self._lock:
-                    if not self.is_active:
+                    if self._silence_fired or not self.is_active:
                         return
-
-                    self.logger.info(f"Silence threshold of {self.config.silence_duration}s reached.")
-                    
-                    # Mark as inactive immediately to prevent re-entry.
-                    # The recorder will call stop() later, but this is a failsafe.
-                    self.is_active = False
-                    
-                    if self.on_silence_detected:
-                        try:
-                            self.on_silence_detected()
-                        except Exception as e:
-                            self.logger.error(f"Error in silence detected callback: {e}")
-    
-    def _calculate_rms(self, window: np.ndarray) -> float:
-        """Calculate RMS (Root Mean Square) of audio window."""
-        return float(np.sqrt(np.mean(window ** 2)))
+                    self._silence_fired = True
+                
+                self.logger.info("Silence threshold of %ss reached.", self.config.silence_duration)
+                
+                # Called without the lock: the recorder's handler calls stop()
+                if self.on_silence_detected:
+                    try:
+                        self.on_silence_detected()
+                    except Exception as e:
+                        self.logger.error("Error in silence detected callback: %s", e)
     
     def _calculate_spectral_energy(self, window: np.ndarray) -> float:
         """Calculate spectral energy of audio window."""
-        # Apply window function to reduce spectral leakage
-        windowed = window * np.hanning(len(window))
+        # Apply the cached window function to reduce spectral leakage
+        windowed = self._windowed_scratch[:len(window)]
+        np.multiply(window, self._hann[:len(window)], out=windowed)
         
-        # Compute FFT
-        fft = np.fft.fft(windowed, n=self.config.fft_size)
+        # Real-input FFT: only the positive frequencies are computed
+        spectrum = np.fft.rfft(windowed, n=self._fft_n)
         
-        # Calculate power spectral density
-        psd = np.abs(fft) ** 2
-        
-        # Focus on speech frequencies (80Hz - 8kHz)
-        speech_band = psd[1:len(psd)//2]  # Skip DC and use only positive frequencies
-        speech_band = speech_band[1:len(speech_band)//10]  # Focus on lower frequencies
-        
-        # Return average spectral energy in speech band
-        return float(np.mean(speech_band))
-    
-    def _calculate_energy(self, window: np.ndarray) -> float:
-        """Calculate total energy of audio window."""
-        return float(np.sum(window ** 2) / len(window))
+        # Power of the speech band only (lower frequencies, DC skipped)
+        band = spectrum[self._band_lo:self._band_hi]
+        return float(np.mean(band.real * band.real + band.imag * band.imag))
     
-    def _update_noise_floor(self, rms_value: float, spectral_value: float) -> None:
+    def _update_noise_floor(self, rms_value: float, spectral_value: float, frames: int) -> None:
         """Update the learned noise floor during learning phase."""
         self.noise_samples += 1
+        self.noise_frames += frames
         
         # Use exponential moving average for adaptation
-        alpha = self.config.adaptation_rate
+        alpha = self._alpha
         
         if self.noise_samples == 1:
             self.learned_noise_floor = rms_value
@@ -279,37 +517,85 @@ class SilenceDetector:
             self.learned_noise_floor = alpha * rms_value + (1 - alpha) * self.learned_noise_floor
         
         # Update adaptive threshold
-        self.adaptive_threshold = self.learned_noise_floor * self.config.noise_margin
+        self.adaptive_threshold = self.learned_noise_floor * self._noise_margin
         
         # Log progress
         if self.noise_samples % 50 == 0:
-            self.logger.debug(f"Learning noise floor: {self.learned_noise_floor:.6f} "
-                            f"(samples: {self.noise_samples})")
+            self.logger.debug("Learning noise floor: %.6f (samples: %d)",
+                              self.learned_noise_floor, self.noise_samples)
     
     def _finalize_noise_learning(self) -> None:
         """Finalize noise learning and set adaptive threshold."""
         if self.noise_samples > 0:
             # Calculate final noise floor from history
             if len(self.rms_history) > 0:
-                recent_rms = list(self.rms_history)[-min(50, len(self.rms_history)):]
-                self.learned_noise_floor = float(np.percentile(recent_rms, 75))  # Use 75th percentile
+                # 75th percentile (lower rank) of the most recent levels.
+                # latest() returns a scratch copy, so it can be partitioned in
+                # place: O(n) instead of percentile()'s sort and interpolation
+                recent_rms = self.rms_history.latest(50)
+                k = (len(recent_rms) - 1) * 3 // 4
+                recent_rms.partition(k)
+                self.learned_noise_floor = float(recent_rms[k])
             
-            self.adaptive_threshold = self.learned_noise_floor * self.config.noise_margin
+            self.adaptive_threshold = self.learned_noise_floor * self._noise_margin
             
-            self.logger.info(f"Noise learning completed: "
-                           f"floor={self.learned_noise_floor:.6f}, "
-                           f"threshold={self.adaptive_threshold:.6f}")
+            self.logger.info("Noise learning completed: floor=%.6f, threshold=%.6f",
+                             self.learned_noise_floor, self.adaptive_threshold)
             
             # Notify noise learned
             if self.on_noise_learned:
                 try:
                     self.on_noise_learned(self.learned_noise_floor)
                 except Exception as e:
-                    self.logger.error(f"Error in noise learned callback: {e}")
+                    self.logger.error("Error in noise learned callback: %s", e)
+    
+    def _configure_detection(self) -> None:
+        """
+        Bind the detection function for the configured strategy.
+        
+        Thresholds and strategy flags are copied into attributes once, so the
+        per-window path makes no enum comparisons and no config lookups.
+        """
+        config = self.config
+        self._rms_thr = config.rms_threshold
+        self._spec_thr = config.spectral_threshold
+        self._energy_thr = config.energy_threshold
+        self._use_spectral = bool(config.enable_spectral)
+        self._use_adaptive = bool(config.enable_adaptive)
+        
+        # Detection only runs once noise learning has finished, so the number
+        # of HYBRID voters is fixed by the configuration
+        n_detectors = 2 + self._use_spectral + self._use_adaptive
+        self._min_votes = max(1, n_detectors // 2)
+        
+        self._silence_samples = int(config.silence_duration * SAMPLE_RATE)
+        
+        self._detect_fn = {
+            DetectionStrategy.RMS: self._detect_rms,
+            DetectionStrategy.SPECTRAL: self._detect_spectral,
+            DetectionStrategy.ADAPTIVE: self._detect_adaptive,
+            DetectionStrategy.HYBRID: self._detect_hybrid,
+        }.get(config.primary_strategy, self._detect_none)
     
-    def _detect_speech(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
+    def _detect_rms(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
+        """Detect speech by RMS level."""
+        return rms_value > self._rms_thr
+    
+    def _detect_spectral(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
+        """Detect speech by speech-band spectral energy."""
+        return spectral_value > self._spec_thr
+    
+    def _detect_adaptive(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
+        """Detect speech against the learned noise floor."""
+        if self.is_learning:
+            # During learning, use a conservative threshold
+            return rms_value > self._rms_thr * 2
+        return rms_value > self.adaptive_threshold
+    
+    def _detect_hybrid(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
         """
-        Detect if audio contains speech using multiple strategies.
+        Detect speech by majority vote of the RMS, spectral, energy and
+        adaptive detectors.
         
         Args:
             rms_value: RMS energy value
@@ -319,40 +605,14 @@ class SilenceDetector:
         Returns:
             True if speech is detected, False if silence
         """
-        if self.config.primary_strategy == DetectionStrategy.RMS:
-            return bool(rms_value > self.config.rms_threshold)
-        
-        elif self.config.primary_strategy == DetectionStrategy.SPECTRAL:
-            return bool(spectral_value > self.config.spectral_threshold)
-        
-        elif self.config.primary_strategy == DetectionStrategy.ADAPTIVE:
-            if self.is_learning:
-                # During learning, use a conservative threshold
-                return bool(rms_value > self.config.rms_threshold * 2)
-            else:
-                return bool(rms_value > self.adaptive_threshold)
-        
-        elif self.config.primary_strategy == DetectionStrategy.HYBRID:
-            # Combine multiple detection methods
-            detections = []
-            
-            # RMS detection
-            detections.append(bool(rms_value > self.config.rms_threshold))
-            
-            # Spectral detection
-            if self.config.enable_spectral:
-                detections.append(bool(spectral_value > self.config.spectral_threshold))
-            
-            # Energy detection
-            detections.append(bool(energy_value > self.config.energy_threshold))
-            
-            # Adaptive detection
-            if self.config.enable_adaptive and not self.is_learning:
-                detections.append(bool(rms_value > self.adaptive_threshold))
-            
-            # Require majority of detections to be positive
-            return sum(detections) >= max(1, len(detections) // 2)
-        
+        votes = ((rms_value > self._rms_thr)
+                 + (self._use_spectral and spectral_value > self._spec_thr)
+                 + (energy_value > self._energy_thr)
+                 + (self._use_adaptive and rms_value > self.adaptive_threshold))
+        return votes >= self._min_votes
+    
+    def _detect_none(self, rms_value: float, spectral_value: float, energy_value: float) -> bool:
+        """Fallback for unknown strategies: never detect speech."""
         return False
     
     def get_status(self) -> Dict[str, Any]:
@@ -368,6 +628,7 @@ class SilenceDetector:
                 'detection_count': self.detection_count,
                 'false_positive_count': self.false_positive_count,
                 'buffer_size': len(self.audio_buffer),
+                'peak_level': self.peak_level,
                 'rms_history_size': len(self.rms_history),
                 'spectral_history_size': len(self.spectral_history)
             }
@@ -376,16 +637,21 @@ class SilenceDetector:
         """Reset the silence detector state."""
         with self._lock:
             self.speech_detected = False
-            self.silence_start_time = 0.0
             self.last_speech_time = 0.0
+            self._audio_clock = 0
+            self._silence_start_sample = -1
+            self._silence_fired = False
             self.audio_buffer.clear()
+            self.envelope_buffer.clear()
             self.rms_history.clear()
             self.spectral_history.clear()
+            self._samples_analyzed = self._samples_written
             
             # Reset adaptive parameters
             self.learned_noise_floor = 0.0
             self.adaptive_threshold = 0.0
             self.noise_samples = 0
+            self.noise_frames = 0
             
             self.logger.debug("Silence detector reset")
     
@@ -393,5 +659,5 @@ class SilenceDetector:
         """Update the silence detection configuration."""
         with self._lock:
             self.config = config
-            self.min_noise_samples = int(self.config.noise_learning_duration * 16000 / self.config.hop_size)
+            self._freeze_config()
             self.logger.info("Silence detector configuration updated") 
\ No newline at end of file
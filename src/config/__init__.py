@@ -9,12 +9,14 @@ This module handles all configuration file operations, including:
 - Access control (user-editable vs system-only settings)
 """
 
-from .config_manager import ConfigManager
-from .config_schema import ConfigSchema, SettingDefinition, SettingAccess, SettingType
+from .config_manager import ConfigManager, get_config_manager
+from .config_schema import ConfigSchema, SettingDefinition, SettingAccess, SettingType, get_config_schema
 
 __all__ = [
     'ConfigManager',
+    'get_config_manager',
     'ConfigSchema', 
+    'get_config_schema',
     'SettingDefinition',
     'SettingAccess',
     'SettingType'
@@ -7,14 +7,30 @@ Now uses a unified schema-based approach to prevent configuration duplication.
 """
 
 import os
+import copy
 import json
 import logging
+import pickle
 import shutil
+import stat
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 
-from .config_schema import ConfigSchema, SettingAccess
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from .config_schema import ConfigSchema, SettingAccess, SettingDefinition, get_config_schema
+
+# Top-level key holding file metadata rather than settings
+META_SECTION = '_meta'
 
 class ConfigManager:
     """Manages W4L configuration files and directory structure."""
@@ -23,17 +39,39 @@ class ConfigManager:
         """Initialize the configuration manager."""
         self.logger = logging.getLogger("w4l.config")
         
-        # Initialize schema
-        self.schema = ConfigSchema()
+        # Shared, immutable schema
+        self.schema = get_config_schema()
+        
+        # Default configuration built once from the (static) schema. Treat as
+        # read-only; get_default_config() hands out independent copies.
+        self._default_config = self.schema.get_default_config()
         
         # Configuration directory structure - UNIFIED LOCATION
         self.config_dir = os.path.expanduser("~/.config/w4l/")
         self.config_file = os.path.join(self.config_dir, "config.json")
         self.logs_dir = os.path.join(self.config_dir, "logs/")
         
+        # Parsed and validated copy of config.json, keyed by the JSON file's
+        # mtime and size and by the schema version, so an unchanged file
+        # skips parsing and validation on the next launch
+        self._cache_file = self.config_file + ".pkl"
+        
         # Single configuration data structure
         self.config: Dict[str, Any] = {}
         
+        # Flat (section, key) -> value view of self.config for lookups;
+        # rebuilt by _index_config() and kept in sync by every writer
+        self._flat: Dict[Tuple[str, str], Any] = {}
+        
+        # Bumped on every change to _flat; invalidates the cached views
+        # built by _collect_settings(), which are keyed by filter
+        self._config_revision = 0
+        self._settings_views: Dict[Tuple[str, Any], Tuple[int, Dict[str, Any]]] = {}
+        
+        # Unsaved changes and nesting depth of batch_update() blocks
+        self._dirty = False
+        self._batch_depth = 0
+        
         # Initialize configuration
         self._ensure_directory_structure()
         self.load_or_create_config()
@@ -41,38 +79,49 @@ class ConfigManager:
     def _ensure_directory_structure(self) -> None:
         """Create the configuration directory structure if it doesn't exist."""
         try:
-            # Create main config directory
-            os.makedirs(self.config_dir, mode=0o755, exist_ok=True)
-            self.logger.info(f"Config directory ensured: {self.config_dir}")
-            
-            # Create logs subdirectory
-            os.makedirs(self.logs_dir, mode=0o755, exist_ok=True)
-            self.logger.info(f"Logs directory ensured: {self.logs_dir}")
-            
-            # Set proper permissions
-            os.chmod(self.config_dir, 0o755)
-            os.chmod(self.logs_dir, 0o755)
+            # Main config directory first, then its logs subdirectory
+            for path in (self.config_dir, self.logs_dir):
+                self._ensure_directory(path, 0o755)
             
         except PermissionError as e:
-            self.logger.error(f"Permission denied creating config directory: {e}")
+            self.logger.error("Permission denied creating config directory: %s", e)
             raise
         except OSError as e:
-            self.logger.error(f"Failed to create config directory structure: {e}")
+            self.logger.error("Failed to create config directory structure: %s", e)
             raise
     
+    def _ensure_directory(self, path: str, mode: int) -> None:
+        """
+        Create a directory with the given permissions, or fix them if needed.
+        
+        An existing directory with the right mode costs a single stat().
+        
+        Args:
+            path: Directory path
+            mode: Required permission bits
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            os.makedirs(path, mode=mode, exist_ok=True)
+            self.logger.info("Created directory: %s", path)
+            st = os.stat(path)
+        
+        # makedirs() modes are subject to the umask, so check either way
+        if stat.S_IMODE(st.st_mode) != mode:
+            os.chmod(path, mode)
+    
     def get_default_config(self) -> Dict[str, Any]:
-        """Get the default configuration structure from schema."""
-        return self.schema.get_default_config()
+        """Get a copy of the default configuration structure from schema."""
+        return copy.deepcopy(self._default_config)
     
     def load_or_create_config(self) -> None:
         """Load existing configuration or create new one with defaults."""
         try:
-            if os.path.exists(self.config_file):
-                self.load_config()
-            else:
-                self.create_default_config()
+            # load_config() creates the defaults itself if the file is missing
+            self.load_config()
         except Exception as e:
-            self.logger.error(f"Failed to load or create config: {e}")
+            self.logger.error("Failed to load or create config: %s", e)
             self.create_default_config()
     
     def create_default_config(self) -> None:
@@ -80,22 +129,55 @@ class ConfigManager:
         try:
             # Create main config from schema
             self.config = self.get_default_config()
+            self._index_config()
             self.save_config()
             
             self.logger.info("Default configuration file created successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to create default config: {e}")
+            self.logger.error("Failed to create default config: %s", e)
             raise
     
     def load_config(self) -> None:
         """Load configuration from file with error handling."""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            st = os.stat(self.config_file)
+            cached = self._read_cache(st)
+            if cached is not None:
+                # Validated when the cache was written
+                self.config = cached
+                self._index_config()
+                self.logger.info("Configuration loaded from cache")
+                return
+            
+            # Read raw bytes: orjson parses them directly and the stdlib
+            # decodes UTF-8 bytes itself
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            self.config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
-            # Validate and repair configuration
-            self.validate_and_repair_config()
+            # save_config() stamps the schema version and a digest of the
+            # settings; a file it wrote against this schema and nobody
+            # edited since is already valid
+            meta = self.config.pop(META_SECTION, None)
+            if (isinstance(meta, dict)
+                    and meta.get('schema_version') == self.schema.version
+                    and meta.get('digest') == self._settings_digest()):
+                repaired = False
+                self._index_config()
+            else:
+                repaired = self.validate_and_repair_config()
+            
+            # Persist repairs (which also refreshes the cache), otherwise
+            # just cache the parsed file
+            if repaired:
+                try:
+                    self.save_config()
+                except Exception:
+                    # Already logged; the repaired values still apply in memory
+                    pass
+            else:
+                self._write_cache(st)
             
             self.logger.info("Configuration loaded successfully")
             
@@ -103,11 +185,11 @@ class ConfigManager:
             self.logger.warning("Config file not found, creating default")
             self.create_default_config()
         except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in config file: {e}")
+            self.logger.error("Invalid JSON in config file: %s", e)
             self.backup_corrupted_file(self.config_file)
             self.create_default_config()
         except Exception as e:
-            self.logger.error(f"Failed to load config: {e}")
+            self.logger.error("Failed to load config: %s", e)
             self.create_default_config()
     
     def save_config(self) -> None:
@@ -116,58 +198,211 @@ class ConfigManager:
             # Create temporary file for atomic write
             temp_file = f"{self.config_file}.tmp"
             
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # Stamp the schema version so the next load can skip validation
+            data = dict(self.config)
+            data[META_SECTION] = {
+                'schema_version': self.schema.version,
+                'digest': self._settings_digest(),
+            }
+            
+            if ORJSON_AVAILABLE:
+                # orjson emits UTF-8 bytes, i.e. non-ASCII is kept as with ensure_ascii=False
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                # Serialize in one pass rather than json.dump()'s many small writes
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
             
-            # Atomic move
-            shutil.move(temp_file, self.config_file)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                self._write_all(fd, content)
+                
+                # Contents must be on disk before the rename makes them visible
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            # Atomic rename; the temp file is on the same filesystem
+            os.replace(temp_file, self.config_file)
+            self._fsync_directory(self.config_dir)
+            self._write_cache(os.stat(self.config_file))
             
             self.logger.info("Configuration saved successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to save config: {e}")
+            self.logger.error("Failed to save config: %s", e)
             raise
     
-    def validate_and_repair_config(self) -> None:
-        """Validate configuration and repair missing/invalid values using schema."""
-        default_config = self.get_default_config()
+    def _settings_digest(self) -> int:
+        """Checksum of the current settings, used to detect edits made outside W4L."""
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.config)
+        else:
+            data = json.dumps(self.config, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return zlib.crc32(data)
+    
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """Write all of `data` to a file descriptor, resuming short writes."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _fsync_directory(self, path: str) -> None:
+        """Flush a directory entry change (e.g. a rename) to disk, where supported."""
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError as e:
+            self.logger.debug("Cannot open %s to fsync it: %s", path, e)
+            return
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            self.logger.debug("Failed to fsync %s: %s", path, e)
+        finally:
+            os.close(fd)
+    
+    def _read_cache(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached configuration if it matches the config file on disk.
+        
+        Args:
+            st: Stat result of the config file
+        
+        Returns:
+            The cached configuration, or None if missing, stale or unreadable
+        """
+        try:
+            with open(self._cache_file, 'rb') as f:
+                mtime_ns, size, schema_version, config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug("Ignoring unreadable config cache: %s", e)
+            return None
+        
+        if mtime_ns != st.st_mtime_ns or size != st.st_size:
+            return None
+        if schema_version != self.schema.version:
+            # Written against a different schema; revalidate
+            return None
+        return config
+    
+    def _write_cache(self, st: os.stat_result) -> None:
+        """
+        Cache the current configuration for the config file described by `st`.
+        
+        The cache is only an optimization, so failures are logged and ignored.
         
-        # Check if all required sections exist
-        for section, defaults in default_config.items():
-            if section not in self.config:
-                self.config[section] = defaults.copy()
-                self.logger.info(f"Added missing section: {section}")
+        Args:
+            st: Stat result of the config file the configuration corresponds to
+        """
+        temp_file = f"{self._cache_file}.tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump((st.st_mtime_ns, st.st_size, self.schema.version, self.config), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self._cache_file)
+        except Exception as e:
+            self.logger.debug("Failed to write config cache: %s", e)
+    
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """
+        Defer saving until the end of a block of changes.
+        
+        Inside the block, set_config_value() only updates the in-memory
+        configuration; the file is written once when the outermost block
+        exits. A failed save raises from the end of the block. If the block
+        itself raises, nothing is written and the exception propagates.
+        
+        Example:
+            with config_manager.batch_update():
+                config_manager.set_config_value('audio', 'buffer_size', 10)
+                config_manager.set_config_value('audio', 'silence_duration', 3.0)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        # Not reached if the block raised: the partial changes stay unsaved
+        # (and marked dirty) instead of masking the original exception
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Save the configuration if it has unsaved changes."""
+        if self._dirty:
+            self.save_config()
+            self._dirty = False
+    
+    def _mark_dirty(self) -> None:
+        """Record an in-memory change; save now unless inside batch_update()."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def validate_and_repair_config(self) -> bool:
+        """
+        Validate configuration and repair missing/invalid values using schema.
+        
+        Returns:
+            bool: True if any value was added or replaced
+        """
+        config = self.config
+        repaired = False
+        
+        # Walk the schema's precompiled per-setting validators
+        for section, key, setting, validate in self.schema.iter_validators():
+            values = config.get(section)
+            if values is None:
+                # Read-only use of the cached defaults; anything stored is copied
+                config[section] = values = copy.deepcopy(self._default_config[section])
+                repaired = True
+                self.logger.info("Added missing section: %s", section)
+            elif key not in values:
+                values[key] = copy.deepcopy(setting.default)
+                repaired = True
+                self.logger.info("Added missing key: %s.%s", section, key)
             else:
-                # Check if all required keys exist in section
-                for key, default_value in defaults.items():
-                    if key not in self.config[section]:
-                        self.config[section][key] = default_value
-                        self.logger.info(f"Added missing key: {section}.{key}")
-                    else:
-                        # Validate the value against schema
-                        full_key = f"{section}.{key}"
-                        is_valid, error_msg = self.schema.validate_value(full_key, self.config[section][key])
-                        if not is_valid:
-                            self.logger.warning(f"Invalid value for {full_key}: {error_msg}, using default")
-                            self.config[section][key] = default_value
+                is_valid, error_msg = validate(values[key])
+                if is_valid:
+                    continue
+                self.logger.warning("Invalid value for %s: %s, using default", setting.key, error_msg)
+                values[key] = copy.deepcopy(setting.default)
+                repaired = True
+        
+        self._index_config()
+        return repaired
+    
+    def _index_config(self) -> None:
+        """Rebuild the flat lookup view after self.config was replaced."""
+        self._config_revision += 1
+        self._flat = {
+            (section, key): value
+            for section, values in self.config.items() if isinstance(values, dict)
+            for key, value in values.items()
+        }
     
     def backup_corrupted_file(self, file_path: str) -> None:
         """Create a backup of a corrupted configuration file."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = f"{file_path}.backup_{timestamp}"
-            shutil.copy2(file_path, backup_path)
-            self.logger.info(f"Created backup of corrupted file: {backup_path}")
+            # Nanosecond timestamps are unique and sort chronologically
+            backup_path = f"{file_path}.backup_{time.time_ns()}"
+            try:
+                # The corrupted file is replaced, not modified, so a hard link
+                # preserves it without copying
+                os.link(file_path, backup_path)
+            except OSError:
+                # copyfile() uses sendfile() where available
+                shutil.copyfile(file_path, backup_path)
+            self.logger.info("Created backup of corrupted file: %s", backup_path)
         except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
+            self.logger.error("Failed to create backup: %s", e)
     
     def get_config_value(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value safely."""
-        try:
-            return self.config.get(section, {}).get(key, default)
-        except Exception as e:
-            self.logger.error(f"Failed to get config value {section}.{key}: {e}")
-            return default
+        return self._flat.get((section, key), default)
     
     def set_config_value(self, section: str, key: str, value: Any) -> bool:
         """
@@ -181,100 +416,103 @@ class ConfigManager:
             
             # Check if setting is user-editable
             if not self.schema.is_user_editable(full_key):
-                self.logger.warning(f"Cannot set system-only setting: {full_key}")
+                self.logger.warning("Cannot set system-only setting: %s", full_key)
                 return False
             
             # Validate the value
             is_valid, error_msg = self.schema.validate_value(full_key, value)
             if not is_valid:
-                self.logger.error(f"Invalid value for {full_key}: {error_msg}")
+                self.logger.error("Invalid value for %s: %s", full_key, error_msg)
                 return False
             
+            # Nothing to save if the value is unchanged
+            section_config = self.config.setdefault(section, {})
+            if key in section_config and section_config[key] == value:
+                return True
+            
             # Set the value
-            if section not in self.config:
-                self.config[section] = {}
-            self.config[section][key] = value
-            self.save_config()
+            section_config[key] = value
+            self._flat[section, key] = value
+            self._config_revision += 1
+            self._mark_dirty()
             
-            self.logger.info(f"Set config value: {full_key} = {value}")
+            self.logger.info("Set config value: %s = %s", full_key, value)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to set config value {section}.{key}: {e}")
+            self.logger.error("Failed to set config value %s.%s: %s", section, key, e)
             return False
     
     def get_user_editable_settings(self) -> Dict[str, Any]:
-        """Get all user-editable settings for the settings UI."""
-        editable_settings = {}
-        
-        for setting in self.schema.get_user_editable_settings():
-            keys = setting.key.split('.')
-            section, key = keys[0], keys[1]
-            
-            if section not in editable_settings:
-                editable_settings[section] = {}
-            
-            editable_settings[section][key] = {
-                'value': self.get_config_value(section, key, setting.default),
-                'definition': setting
-            }
-        
-        return editable_settings
+        """Get all user-editable settings for the settings UI (treat as read-only)."""
+        return self._collect_settings(('access', SettingAccess.USER_EDITABLE),
+                                      self.schema.get_user_editable_settings)
     
     def get_advanced_settings(self) -> Dict[str, Any]:
-        """Get all advanced settings for the advanced settings UI."""
-        advanced_settings = {}
-        
-        for setting in self.schema.get_advanced_settings():
-            keys = setting.key.split('.')
-            section, key = keys[0], keys[1]
-            
-            if section not in advanced_settings:
-                advanced_settings[section] = {}
-            
-            advanced_settings[section][key] = {
-                'value': self.get_config_value(section, key, setting.default),
-                'definition': setting
-            }
-        
-        return advanced_settings
+        """Get all advanced settings for the advanced settings UI (treat as read-only)."""
+        return self._collect_settings(('access', SettingAccess.ADVANCED),
+                                      self.schema.get_advanced_settings)
     
     def get_settings_by_category(self, category: str) -> Dict[str, Any]:
-        """Get all settings in a specific category."""
-        category_settings = {}
+        """Get all settings in a specific category (treat as read-only)."""
+        return self._collect_settings(('category', category),
+                                      lambda: self.schema.get_settings_by_category(category))
+    
+    def _collect_settings(self, view: Tuple[str, Any],
+                          settings: Callable[[], List[SettingDefinition]]) -> Dict[str, Any]:
+        """
+        Group the given settings by section with their current values.
         
-        for setting in self.schema.get_settings_by_category(category):
-            keys = setting.key.split('.')
-            section, key = keys[0], keys[1]
-            
-            if section not in category_settings:
-                category_settings[section] = {}
+        Results are cached per view and reused until the configuration
+        changes, so they are shared between callers.
+        
+        Args:
+            view: Cache key identifying the filter
+            settings: Returns the schema settings in the view
+        
+        Returns:
+            Dict[str, Any]: {section: {key: {'value': ..., 'definition': ...}}}
+        """
+        cached = self._settings_views.get(view)
+        if cached is not None and cached[0] == self._config_revision:
+            return cached[1]
+        
+        collected = {}
+        flat = self._flat
+        for setting in settings():
+            section, key = setting.section, setting.key_name
             
-            category_settings[section][key] = {
-                'value': self.get_config_value(section, key, setting.default),
+            collected.setdefault(section, {})[key] = {
+                'value': flat.get((section, key), setting.default),
                 'definition': setting
             }
         
-        return category_settings
+        self._settings_views[view] = (self._config_revision, collected)
+        return collected
     
     def reset_to_defaults(self, category: Optional[str] = None) -> None:
         """Reset settings to defaults, optionally for a specific category."""
+        changed = False
         if category:
             # Reset specific category
             category_settings = self.schema.get_settings_by_category(category)
             for setting in category_settings:
-                keys = setting.key.split('.')
-                section, key = keys[0], keys[1]
-                if section not in self.config:
-                    self.config[section] = {}
-                self.config[section][key] = setting.default
-            self.logger.info(f"Reset {category} settings to defaults")
-        else:
+                section, key = setting.section, setting.key_name
+                section_config = self.config.setdefault(section, {})
+                if key not in section_config or section_config[key] != setting.default:
+                    section_config[key] = self._flat[section, key] = copy.deepcopy(setting.default)
+                    self._config_revision += 1
+                    changed = True
+            self.logger.info("Reset %s settings to defaults", category)
+        elif self.config != self._default_config:
             # Reset all settings
             self.config = self.get_default_config()
+            self._index_config()
+            changed = True
             self.logger.info("Reset all settings to defaults")
         
-        self.save_config()
+        if changed:
+            self._mark_dirty()
     
     def get_config_dir(self) -> str:
         """Get the configuration directory path."""
@@ -295,4 +533,28 @@ class ConfigManager:
     
     def get_hotkeys(self) -> Dict[str, Any]:
         """Get hotkeys configuration (legacy compatibility)."""
-        return self.get_settings_by_category("hotkeys") 
\ No newline at end of file
+        return self.get_settings_by_category("hotkeys")
+
+
+# Process-wide instance shared by get_config_manager()
+_instance: Optional[ConfigManager] = None
+_instance_lock = threading.Lock()
+
+
+def get_config_manager() -> ConfigManager:
+    """
+    Get the shared configuration manager, creating it on first use.
+    
+    Constructing a ConfigManager checks the directory structure and loads the
+    configuration file, so application code should share this instance
+    rather than create its own.
+    
+    Returns:
+        ConfigManager: The process-wide configuration manager
+    """
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = ConfigManager()
+    return _instance
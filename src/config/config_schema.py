@@ -5,10 +5,14 @@ Configuration Schema for W4L.
 Defines the structure, validation rules, and access control for all configuration settings.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
+import copy
+import hashlib
 import json
+import sys
 
 class SettingAccess(Enum):
     """Defines who can modify a setting."""
@@ -26,7 +30,28 @@ class SettingType(Enum):
     OBJECT = "object"
     ARRAY = "array"
 
-@dataclass
+# isinstance() targets for the types validate_value() checks, and the
+# matching error message suffixes
+_TYPE_CHECKS = {
+    SettingType.INTEGER: int,
+    SettingType.FLOAT: (int, float),
+    SettingType.STRING: str,
+    SettingType.BOOLEAN: bool,
+}
+_TYPE_ERRORS = {
+    SettingType.INTEGER: "must be an integer",
+    SettingType.FLOAT: "must be a number",
+    SettingType.STRING: "must be a string",
+    SettingType.BOOLEAN: "must be a boolean",
+}
+
+# Validates one value: returns (is_valid, error_message)
+Validator = Callable[[Any], Tuple[bool, Optional[str]]]
+
+# __slots__ for dataclasses needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SettingDefinition:
     """Definition of a configuration setting."""
     key: str
@@ -41,6 +66,16 @@ class SettingDefinition:
     category: str = "general"
     deprecated: bool = False
     replacement: Optional[str] = None
+    
+    # "section" and "key" parts of the dotted key, split once up front
+    section: str = field(init=False, repr=False, compare=False)
+    key_name: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen: derived fields have to bypass the generated __setattr__
+        section, _, key_name = self.key.partition('.')
+        object.__setattr__(self, 'section', section)
+        object.__setattr__(self, 'key_name', key_name)
 
 class ConfigSchema:
     """Defines the complete configuration schema for W4L."""
@@ -48,7 +83,31 @@ class ConfigSchema:
     def __init__(self):
         """Initialize the configuration schema."""
         self.settings: Dict[str, SettingDefinition] = {}
+        
+        # Settings grouped by access level and by category, filled in as
+        # settings are added so the filter methods never scan the schema
+        self._by_access: Dict[SettingAccess, List[SettingDefinition]] = {
+            access: [] for access in SettingAccess
+        }
+        self._by_category: Dict[str, List[SettingDefinition]] = {}
+        
+        # Per-setting validators specialized from the rules at definition
+        # time, as (section, key, setting, validator) and by full key
+        self._validator_entries: List[Tuple[str, str, SettingDefinition, Validator]] = []
+        self._validators: Dict[str, Validator] = {}
+        
+        # Nested default configuration, built on first use
+        self._default_config_cache: Optional[Dict[str, Any]] = None
+        
         self._define_schema()
+        
+        # Fingerprint of every setting's key, type, default and rules, so
+        # files written against this exact schema can be recognized
+        rules = [
+            (s.key, s.type.value, s.default, s.min_value, s.max_value, s.allowed_values)
+            for s in self.settings.values()
+        ]
+        self.version = hashlib.sha1(repr(rules).encode('utf-8')).hexdigest()[:16]
     
     def _define_schema(self) -> None:
         """Define all configuration settings with their rules."""
@@ -104,6 +163,18 @@ class ConfigSchema:
             category="audio"
         ))
         
+        self._add_setting(SettingDefinition(
+            key="audio.block_size",
+            type=SettingType.INTEGER,
+            access=SettingAccess.ADVANCED,
+            default=1024,
+            description="Frames per audio stream block (larger blocks reduce callback overhead but add latency)",
+            min_value=256,
+            max_value=16000,
+            unit="frames",
+            category="audio"
+        ))
+        
         self._add_setting(SettingDefinition(
             key="audio.capture_mode",
             type=SettingType.STRING,
@@ -432,7 +503,74 @@ class ConfigSchema:
     
     def _add_setting(self, setting: SettingDefinition) -> None:
         """Add a setting definition to the schema."""
+        if setting.key in self.settings:
+            raise ValueError(f"Duplicate setting definition: {setting.key}")
         self.settings[setting.key] = setting
+        self._by_access[setting.access].append(setting)
+        self._by_category.setdefault(setting.category, []).append(setting)
+        
+        validator = self._compile_validator(setting)
+        self._validator_entries.append((setting.section, setting.key_name, setting, validator))
+        self._validators[setting.key] = validator
+    
+    @staticmethod
+    def _compile_validator(setting: SettingDefinition) -> Validator:
+        """
+        Build the validator for one setting from only its applicable rules.
+        
+        Rules are checked in order (type, minimum, maximum, allowed values)
+        and their error messages are formatted here, once, so validating a
+        value does no rule dispatch or string formatting.
+        """
+        key = setting.key
+        value_type = _TYPE_CHECKS.get(setting.type)
+        min_value = setting.min_value
+        max_value = setting.max_value
+        allowed_values = setting.allowed_values
+        
+        # Hash lookup for allowed values where they are all hashable
+        allowed_lookup = allowed_values
+        if allowed_values is not None:
+            try:
+                allowed_lookup = frozenset(allowed_values)
+            except TypeError:
+                pass
+        
+        type_error = f"Setting {key} {_TYPE_ERRORS[setting.type]}" if value_type is not None else None
+        min_error = f"Setting {key} must be >= {min_value}"
+        max_error = f"Setting {key} must be <= {max_value}"
+        allowed_error = f"Setting {key} must be one of: {allowed_values}"
+        
+        def validate(value: Any) -> Tuple[bool, Optional[str]]:
+            if value_type is not None and not isinstance(value, value_type):
+                return False, type_error
+            # Range validation (only for numeric types)
+            if isinstance(value, (int, float)):
+                if min_value is not None and value < min_value:
+                    return False, min_error
+                if max_value is not None and value > max_value:
+                    return False, max_error
+            if allowed_values is not None:
+                try:
+                    allowed = value in allowed_lookup
+                except TypeError:
+                    # Unhashable value; compare against the list instead
+                    allowed = value in allowed_values
+                if not allowed:
+                    return False, allowed_error
+            return True, None
+        
+        return validate
+    
+    def iter_validators(self) -> Iterator[Tuple[str, str, SettingDefinition, Validator]]:
+        """
+        Iterate over the compiled validator of every setting.
+        
+        Yields:
+            (section, key, setting, validator) where validator(value)
+            returns (is_valid, error_message) like validate_value()
+        """
+        return iter(self._validator_entries)
     
     def get_setting(self, key: str) -> Optional[SettingDefinition]:
         """Get a setting definition by key."""
@@ -440,24 +578,15 @@ class ConfigSchema:
     
     def get_user_editable_settings(self) -> List[SettingDefinition]:
         """Get all user-editable settings."""
-        return [
-            setting for setting in self.settings.values()
-            if setting.access == SettingAccess.USER_EDITABLE
-        ]
+        return list(self._by_access[SettingAccess.USER_EDITABLE])
     
     def get_advanced_settings(self) -> List[SettingDefinition]:
         """Get all advanced settings."""
-        return [
-            setting for setting in self.settings.values()
-            if setting.access == SettingAccess.ADVANCED
-        ]
+        return list(self._by_access[SettingAccess.ADVANCED])
     
     def get_settings_by_category(self, category: str) -> List[SettingDefinition]:
         """Get all settings in a specific category."""
-        return [
-            setting for setting in self.settings.values()
-            if setting.category == category
-        ]
+        return list(self._by_category.get(category, ()))
     
     def validate_value(self, key: str, value: Any) -> tuple[bool, Optional[str]]:
         """
@@ -466,46 +595,21 @@ class ConfigSchema:
         Returns:
             (is_valid, error_message)
         """
-        setting = self.get_setting(key)
-        if not setting:
+        validator = self._validators.get(key)
+        if validator is None:
             return False, f"Unknown setting: {key}"
-        
-        # Type validation
-        if setting.type == SettingType.INTEGER and not isinstance(value, int):
-            return False, f"Setting {key} must be an integer"
-        elif setting.type == SettingType.FLOAT and not isinstance(value, (int, float)):
-            return False, f"Setting {key} must be a number"
-        elif setting.type == SettingType.STRING and not isinstance(value, str):
-            return False, f"Setting {key} must be a string"
-        elif setting.type == SettingType.BOOLEAN and not isinstance(value, bool):
-            return False, f"Setting {key} must be a boolean"
-        
-        # Range validation (only for numeric types)
-        if setting.min_value is not None and isinstance(value, (int, float)):
-            if value < setting.min_value:
-                return False, f"Setting {key} must be >= {setting.min_value}"
-        if setting.max_value is not None and isinstance(value, (int, float)):
-            if value > setting.max_value:
-                return False, f"Setting {key} must be <= {setting.max_value}"
-        
-        # Allowed values validation
-        if setting.allowed_values is not None and value not in setting.allowed_values:
-            return False, f"Setting {key} must be one of: {setting.allowed_values}"
-        
-        return True, None
+        return validator(value)
     
     def get_default_config(self) -> Dict[str, Any]:
-        """Get the complete default configuration."""
-        config = {}
-        for setting in self.settings.values():
-            keys = setting.key.split('.')
-            current = config
-            for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-            current[keys[-1]] = setting.default
-        return config
+        """Get a copy of the complete default configuration."""
+        if self._default_config_cache is None:
+            config = {}
+            for setting in self.settings.values():
+                config.setdefault(setting.section, {})[setting.key_name] = setting.default
+            self._default_config_cache = config
+        
+        # Defaults include lists and dicts, so callers get their own copy
+        return copy.deepcopy(self._default_config_cache)
     
     def is_user_editable(self, key: str) -> bool:
         """Check if a setting is user-editable."""
@@ -515,4 +619,18 @@ class ConfigSchema:
     def is_system_only(self, key: str) -> bool:
         """Check if a setting is system-only."""
         setting = self.get_setting(key)
-        return setting is not None and setting.access == SettingAccess.SYSTEM_ONLY 
\ No newline at end of file
+        return setting is not None and setting.access == SettingAccess.SYSTEM_ONLY
+
+
+@lru_cache(maxsize=1)
+def get_config_schema() -> ConfigSchema:
+    """
+    Get the shared configuration schema, building it on first use.
+    
+    The schema does not change at runtime, so every ConfigManager shares one
+    instance instead of redefining all settings.
+    
+    Returns:
+        ConfigSchema: The process-wide configuration schema
+    """
+    return ConfigSchema()
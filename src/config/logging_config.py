@@ -4,12 +4,37 @@ Logging configuration for W4L.
 Sets up logging for the application with appropriate levels and handlers.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Level names accepted by setup_logging() and set_log_level()
+_LEVEL_MAP = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Background thread that runs the real handlers for records queued by callers
+_listener: Optional[QueueListener] = None
+
+
+def _resolve_level(name: str) -> int:
+    """
+    Convert a level name such as "debug" or "INFO" to its logging level.
+    
+    Raises:
+        ValueError: If the name is not a known logging level
+    """
+    try:
+        return _LEVEL_MAP[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {name}") from None
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -26,10 +51,12 @@ def setup_logging(
     """
     # Create logger
     logger = logging.getLogger("w4l")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(_resolve_level(log_level))
     
     # Clear any existing handlers
     logger.handlers.clear()
+    _stop_listener()
+    handlers = []
     
     # Create formatter
     formatter = logging.Formatter(
@@ -42,7 +69,7 @@ def setup_logging(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if log_file is None:
@@ -50,19 +77,49 @@ def setup_logging(
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = str(log_dir / "w4l.log")
     
+    file_error = None
     try:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
+        file_error = e
+    
+    # Callers only enqueue records; a background thread does the writes, so
+    # logging from the audio threads never blocks on console or disk I/O
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _start_listener(QueueListener(log_queue, *handlers, respect_handler_level=True))
+    
+    if file_error is not None:
         # If file logging fails, just log to console
-        logger.warning(f"Failed to set up file logging: {e}")
+        logger.warning(f"Failed to set up file logging: {file_error}")
     
     # Log startup message
     logger.info("W4L logging initialized")
 
 
+def _start_listener(listener: QueueListener) -> None:
+    """Start the queue listener that runs the real handlers."""
+    global _listener
+    _listener = listener
+    listener.start()
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, writing out any records still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Flush queued records when the interpreter exits
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -83,12 +140,14 @@ def set_log_level(level: str) -> None:
     Args:
         level: New logging level
     """
+    new_level = _resolve_level(level)
     logger = logging.getLogger("w4l")
-    logger.setLevel(getattr(logging, level.upper()))
+    if logger.level == new_level:
+        return
     
-    # Update all child loggers
-    for handler in logger.handlers:
-        if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-            handler.setLevel(logging.INFO)
-        else:
-            handler.setLevel(getattr(logging, level.upper())) 
\ No newline at end of file
+    # Filter on the logger, in the calling thread. The handlers run later on
+    # the listener thread, so changing their levels would also drop records
+    # logged before this call that are still queued. The console handler
+    # stays at INFO and the file handler at DEBUG, below any logger level
+    # that lets those records through.
+    logger.setLevel(new_level) 
\ No newline at end of file
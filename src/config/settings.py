@@ -4,11 +4,44 @@ Settings management for W4L.
 Handles application configuration and user preferences.
 """
 
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
 import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from .config_schema import get_config_schema
+from .logging_config import get_logger
+
+logger = get_logger("settings")
+
+
+# Schema keys and the keys older settings files stored them under
+_LEGACY_KEYS = {
+    "gui.window_width": "ui.window_width",
+    "gui.window_height": "ui.window_height",
+    "gui.theme": "ui.theme",
+    "hotkeys.start_recording": "hotkey.record",
+    "hotkeys.cancel_recording": "hotkey.cancel",
+}
+
+# Marks a key missing from the flat view (None is a valid setting value)
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its parts, cached per key."""
+    return tuple(key.split('.'))
+
 
 class Settings:
     """
@@ -26,6 +59,14 @@ class Settings:
         """
         self.config_file = config_file or self._get_default_config_path()
         self._settings: Dict[str, Any] = {}
+        
+        # Leaf values of _settings by full dotted key, for single-lookup get()
+        self._flat: Dict[str, Any] = {}
+        
+        # Unsaved changes and nesting depth of batch_update() blocks
+        self._dirty = False
+        self._batch_depth = 0
+        
         self._load_settings()
     
     def _get_default_config_path(self) -> str:
@@ -38,48 +79,91 @@ class Settings:
         """Load settings from configuration file."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self._settings = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                self._settings = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             else:
                 self._settings = self._get_default_settings()
                 self._save_settings()
         except Exception as e:
             # Fallback to default settings if loading fails
             self._settings = self._get_default_settings()
+        self._index_settings()
+        
+        if self._migrate_settings():
+            self._mark_dirty()
+    
+    def _index_settings(self) -> None:
+        """Rebuild the flat view of the leaf settings."""
+        flat = {}
+        
+        def flatten(values: Dict[str, Any], prefix: str) -> None:
+            for k, v in values.items():
+                full_key = f"{prefix}.{k}" if prefix else k
+                if isinstance(v, dict):
+                    flatten(v, full_key)
+                else:
+                    flat[full_key] = v
+        
+        if isinstance(self._settings, dict):
+            flatten(self._settings, "")
+        self._flat = flat
     
     def _save_settings(self) -> None:
         """Save settings to configuration file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            # Serialize in one pass, then swap the file in atomically so a
+            # crash mid-write cannot leave a truncated settings file
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._settings, indent=2).encode('utf-8')
+            temp_file = f"{self.config_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
         except Exception as e:
             # TODO: Log error when logging is implemented
             pass
     
     def _get_default_settings(self) -> Dict[str, Any]:
-        """Get default application settings."""
-        return {
-            "audio": {
-                "sample_rate": 16000,
-                "channels": 1,
-                "chunk_size": 1024,
-                "silence_threshold": 0.01,
-                "silence_duration": 5.0
-            },
-            "hotkey": {
-                "record": "Ctrl+Shift+R",
-                "cancel": "Escape"
-            },
-            "ui": {
-                "window_width": 400,
-                "window_height": 300,
-                "theme": "dark"
-            },
-            "transcription": {
-                "model": "small",
-                "language": "en"
-            }
-        }
+        """Get default application settings from the configuration schema."""
+        return get_config_schema().get_default_config()
+    
+    def _migrate_settings(self) -> bool:
+        """
+        Rebase the loaded settings onto the configuration schema.
+        
+        Valid values of known settings, including ones stored under a legacy
+        key, are kept. Invalid values are logged and replaced by their schema
+        default, missing settings get their default and keys the schema does
+        not define are dropped.
+        
+        Returns:
+            bool: True if the settings changed
+        """
+        schema = get_config_schema()
+        migrated = schema.get_default_config()
+        for section, key, setting, validate in schema.iter_validators():
+            value = self.get(setting.key, _MISSING)
+            if value is _MISSING and setting.key in _LEGACY_KEYS:
+                value = self.get(_LEGACY_KEYS[setting.key], _MISSING)
+            if value is _MISSING:
+                continue
+            
+            is_valid, error_msg = validate(value)
+            if is_valid:
+                migrated[section][key] = value
+            else:
+                logger.warning("Invalid value for %s: %s, using default", setting.key, error_msg)
+        
+        if migrated == self._settings:
+            return False
+        self._settings = migrated
+        self._index_settings()
+        return True
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -92,7 +176,12 @@ class Settings:
         Returns:
             Setting value or default
         """
-        keys = key.split('.')
+        # Leaf settings are a single lookup; sections take the nested walk
+        value = self._flat.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        keys = _split_key(key)
         value = self._settings
         
         try:
@@ -110,7 +199,7 @@ class Settings:
             key: Setting key (supports dot notation like 'audio.sample_rate')
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         current = self._settings
         
         # Navigate to the parent of the target key
@@ -121,9 +210,51 @@ class Settings:
         
         # Set the value
         current[keys[-1]] = value
-        self._save_settings()
+        if key in self._flat and not isinstance(value, dict):
+            # Replacing a leaf with a leaf leaves the rest of the view intact
+            self._flat[key] = value
+        else:
+            self._index_settings()
+        self._mark_dirty()
+    
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """
+        Defer saving until the end of a block of changes.
+        
+        Inside the block, set() only updates the in-memory settings; the file
+        is written once when the outermost block exits.
+        If the block raises, nothing is written and the exception propagates.
+        
+        Example:
+            with settings.batch_update():
+                settings.set('audio.channels', 1)
+                settings.set('ui.theme', 'light')
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        # Not reached if the block raised: the partial changes stay unsaved
+        # (and marked dirty) instead of masking the original exception
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Save the settings if they have unsaved changes."""
+        if self._dirty:
+            self._save_settings()
+            self._dirty = False
+    
+    def _mark_dirty(self) -> None:
+        """Record an in-memory change; save now unless inside batch_update()."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
     
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
         self._settings = self._get_default_settings()
-        self._save_settings() 
\ No newline at end of file
+        self._index_settings()
+        self._mark_dirty() 
\ No newline at end of file
@@ -17,7 +17,7 @@ from .model_manager_ui import ModelManagerUI
 from .styles import *
 from config import ConfigManager
 from transcription.model_manager import ModelManager
-from audio.recorder import AudioRecorder
+from audio.recorder import AudioRecorder, flush_threshold_frames
 from audio.recording_state_machine import RecordingStateMachine, RecordingState, RecordingEvent
 import os
 import traceback
@@ -238,13 +238,16 @@ class W4LMainWindow(QMainWindow):
             sample_rate = self.config_manager.get_config_value('audio', 'sample_rate', 16000)
             channels = self.config_manager.get_config_value('audio', 'channels', 1)
             buffer_size = self.config_manager.get_config_value('audio', 'buffer_size', 5)
+            block_size = self.config_manager.get_config_value(
+                'audio', 'block_size', flush_threshold_frames('waveform', sample_rate)
+            )
             
             # Create recorder
             recorder = AudioRecorder(
                 device_id=device_id,
                 sample_rate=sample_rate,
                 channels=channels,
-                blocksize=1024
+                blocksize=block_size
             )
             
             # Set up callbacks
@@ -621,7 +624,8 @@ class W4LMainWindow(QMainWindow):
         state_machine = RecordingStateMachine()
         
         # Connect state machine signals to UI updates
-        state_machine.state_changed.connect(self._on_state_changed)
+        # Coalesced, event-loop delivered: the UI only needs the latest state
+        state_machine.state_settled.connect(self._on_state_changed)
         state_machine.error_occurred.connect(self._on_state_machine_error)
         state_machine.recovery_attempted.connect(self._on_recovery_attempted)
         
@@ -868,9 +872,9 @@ if __name__ == '__main__':
     # This block is for direct testing of the main window
     app = QApplication(sys.argv)
     
-    # Create a ConfigManager for testing
-    from config import ConfigManager
-    config_manager = ConfigManager()
+    # Use the shared ConfigManager for testing
+    from config import get_config_manager
+    config_manager = get_config_manager()
     
     # Create a ModelManager for testing
     from transcription.model_manager import ModelManager
@@ -492,18 +492,20 @@ class SettingsDialog(QDialog):
         """Save the current settings to the ConfigManager."""
         self.logger.info("Applying settings...")
         
-        selected_device_index = self.audio_device_combo.currentIndex()
-        if selected_device_index != -1:
-            selected_device = self.audio_device_combo.itemData(selected_device_index)
-            self.config_manager.set_config_value('audio', 'device', selected_device.name)
-            self.config_manager.set_config_value('audio', 'device_id', selected_device.device_id)
-
-        self.config_manager.set_config_value('audio', 'capture_mode', self.capture_mode_combo.currentData())
-        self.config_manager.set_config_value('audio', 'buffer_size', self.buffer_size_spinbox.value())
-        self.config_manager.set_config_value('audio', 'save_path', self.file_path_edit.text())
-        
-        # Save silence detection settings
-        self.save_silence_settings()
+        # Write the config file once for the whole dialog, not once per setting
+        with self.config_manager.batch_update():
+            selected_device_index = self.audio_device_combo.currentIndex()
+            if selected_device_index != -1:
+                selected_device = self.audio_device_combo.itemData(selected_device_index)
+                self.config_manager.set_config_value('audio', 'device', selected_device.name)
+                self.config_manager.set_config_value('audio', 'device_id', selected_device.device_id)
+
+            self.config_manager.set_config_value('audio', 'capture_mode', self.capture_mode_combo.currentData())
+            self.config_manager.set_config_value('audio', 'buffer_size', self.buffer_size_spinbox.value())
+            self.config_manager.set_config_value('audio', 'save_path', self.file_path_edit.text())
+            
+            # Save silence detection settings
+            self.save_silence_settings()
         
         self.logger.info("Settings applied and saved.")
         
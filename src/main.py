@@ -19,7 +19,7 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtGui import QIcon, QAction
 from gui.main_window import W4LMainWindow
 from gui.settings_dialog import SettingsDialog
-from config import ConfigManager
+from config import get_config_manager
 from transcription.model_manager import ModelManager
 
 class W4LApplication(QObject):
@@ -77,7 +77,7 @@ class W4LApplication(QObject):
         # --- End Single Instance Lock ---
         
         # Initialize configuration manager
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.logger.info("Configuration manager initialized")
 
         # Initialize model manager
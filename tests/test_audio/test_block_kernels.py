@@ -0,0 +1,74 @@
+"""
+Pytest tests for the per-block audio kernels.
+
+Checks each kernel (compiled or NumPy fallback) against a plain NumPy reference.
+
+Run with: PYTHONPATH=src pytest tests/test_audio/test_block_kernels.py
+"""
+
+import numpy as np
+import pytest
+from audio import block_kernels
+from audio.block_kernels import downmix_int16, int16_envelope, int16_to_float32
+
+@pytest.fixture(autouse=True, params=["numba", "numpy"])
+def kernel_path(request, monkeypatch):
+    """Run each test against both the compiled and the NumPy kernels."""
+    if request.param == "numba" and not block_kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(block_kernels, "NUMBA_AVAILABLE", request.param == "numba")
+    return request.param
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1234)
+
+def _random_block(rng, frames, channels):
+    block = rng.integers(-32768, 32768, size=(frames, channels), dtype=np.int16)
+    # Make sure the extremes are exercised
+    block[0, 0] = -32768
+    block[-1, -1] = 32767
+    return np.ascontiguousarray(block)
+
+@pytest.mark.parametrize("channels", [1, 2, 3])
+def test_envelope_matches_numpy(rng, channels):
+    """Test peak and sum of squares against an int64 NumPy reference."""
+    block = _random_block(rng, 1024, channels)
+    scratch = np.empty(block.shape, dtype=np.int32)
+
+    peak, sum_sq = int16_envelope(block, scratch)
+
+    wide = block.astype(np.int64)
+    assert peak == int(np.abs(wide).max()) == 32768
+    assert sum_sq == int((wide * wide).sum())
+
+def test_envelope_of_silence():
+    """Test that an all-zero block has zero peak and energy."""
+    block = np.zeros((256, 2), dtype=np.int16)
+    assert int16_envelope(block, np.empty(block.shape, dtype=np.int32)) == (0, 0)
+
+@pytest.mark.parametrize("channels", [1, 2])
+def test_to_float32_matches_numpy(rng, channels):
+    """Test int16 to float32 scaling against block * scale."""
+    block = _random_block(rng, 512, channels)
+    out = np.empty(block.shape, dtype=np.float32)
+    scale = np.float32(1.0 / 32768.0)
+
+    int16_to_float32(block, out, scale)
+
+    np.testing.assert_array_equal(out, block.astype(np.float32) * scale)
+    assert out.min() == -1.0
+
+@pytest.mark.parametrize("channels", [2, 3, 6])
+def test_downmix_matches_numpy(rng, channels):
+    """Test downmixing against the floored channel mean."""
+    block = _random_block(rng, 1024, channels)
+    frames = len(block)
+    sum_scratch = np.empty((frames, 1), dtype=np.int32)
+    out = np.empty((frames, 1), dtype=np.int16)
+
+    mono = downmix_int16(block, sum_scratch, out)
+
+    expected = np.floor_divide(block.astype(np.int64).sum(axis=1, keepdims=True), channels)
+    assert mono is out
+    np.testing.assert_array_equal(mono, expected.astype(np.int16))
@@ -0,0 +1,180 @@
+"""
+Pytest tests for the recording state machine.
+
+Run with: PYTHONPATH=src pytest tests/test_audio/test_recording_state_machine.py
+"""
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from audio.recording_state_machine import (
+    CoreStateMachine, RecordingStateMachine, RecordingState, RecordingEvent
+)
+
+@pytest.fixture
+def state_machine():
+    """Create a fresh state machine fixture."""
+    return RecordingStateMachine()
+
+def test_initial_state(state_machine):
+    """Test that a new state machine starts idle."""
+    assert state_machine.get_state() == RecordingState.IDLE
+    assert state_machine.can_start_recording()
+    assert not state_machine.can_stop_recording()
+
+def test_record_and_stop_cycle(state_machine):
+    """Test a normal start -> stop -> cleanup cycle."""
+    calls = []
+    state_machine.on_start_recording = lambda: calls.append("start")
+    state_machine.on_stop_recording = lambda: calls.append("stop")
+
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    assert state_machine.is_recording()
+
+    state_machine.handle_event(RecordingEvent.SILENCE_DETECTED)
+    assert state_machine.get_state() == RecordingState.STOPPING
+
+    state_machine.handle_event(RecordingEvent.CLEANUP_COMPLETED)
+    assert state_machine.get_state() == RecordingState.FINISHED
+    assert calls == ["start", "stop"]
+
+def test_invalid_event_keeps_state(state_machine):
+    """Test that an invalid event is rejected without changing state."""
+    errors = []
+    state_machine.error_occurred.connect(errors.append)
+
+    state_machine.handle_event(RecordingEvent.CLEANUP_COMPLETED)
+    assert state_machine.get_state() == RecordingState.IDLE
+    assert errors == ["Invalid event CLEANUP_COMPLETED for state IDLE"]
+
+def test_state_changed_signal(state_machine):
+    """Test that transitions are reported through the state_changed signal."""
+    changes = []
+    state_machine.state_changed.connect(lambda old, new, event: changes.append((old, new, event)))
+
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    assert changes == [(RecordingState.IDLE, RecordingState.RECORDING, RecordingEvent.START_REQUESTED)]
+
+def test_handler_failure_moves_to_error(state_machine):
+    """Test that an exception in a state handler moves the machine to ERROR."""
+    reported = []
+
+    def failing_start():
+        raise RuntimeError("device busy")
+
+    state_machine.on_start_recording = failing_start
+    state_machine.on_error = reported.append
+
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    assert state_machine.get_state() == RecordingState.ERROR
+    assert [str(e) for e in reported] == ["device busy"]
+
+def test_recovery(state_machine):
+    """Test successful and failed recovery from the ERROR state."""
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    state_machine.handle_event(RecordingEvent.ERROR_OCCURRED, error=RuntimeError("lost device"))
+    assert state_machine.get_state() == RecordingState.ERROR
+
+    state_machine.on_recovery = lambda: None
+    state_machine.handle_event(RecordingEvent.RECOVERY_ATTEMPTED)
+    assert state_machine.get_state() == RecordingState.IDLE
+
+    def failing_recovery():
+        raise RuntimeError("still lost")
+
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    state_machine.handle_event(RecordingEvent.ERROR_OCCURRED, error=RuntimeError("lost device"))
+    state_machine.on_recovery = failing_recovery
+    state_machine.handle_event(RecordingEvent.RECOVERY_ATTEMPTED)
+    assert state_machine.get_state() == RecordingState.ERROR
+
+def test_get_state_info(state_machine):
+    """Test the state summary reported for the UI."""
+    info = state_machine.get_state_info()
+    assert info['state'] == 'IDLE'
+    assert not info['is_recording']
+    assert info['can_start']
+    assert not info['can_stop']
+    assert set(info['valid_events']) == {'START_REQUESTED', 'MODEL_LOAD_REQUESTED'}
+
+def test_reset_to_idle(state_machine):
+    """Test resetting from an arbitrary state."""
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    state_machine.reset_to_idle()
+    assert state_machine.get_state() == RecordingState.IDLE
+
+def test_reset_when_idle_is_silent(state_machine):
+    """Test that resetting an idle machine does not report a state change."""
+    changes = []
+    state_machine.state_changed.connect(lambda old, new, event: changes.append(event))
+
+    state_machine.reset_to_idle()
+    assert changes == []
+
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    state_machine.reset_to_idle()
+    assert changes == [RecordingEvent.START_REQUESTED, RecordingEvent.RESET]
+
+def test_core_state_machine_without_qt():
+    """Test that the Qt-free core runs the same transitions and handlers."""
+    core = CoreStateMachine()
+    calls = []
+    core.on_start_recording = lambda: calls.append("start")
+
+    core.handle_event(RecordingEvent.START_REQUESTED)
+    core.handle_event(RecordingEvent.CLEANUP_COMPLETED)  # invalid while recording
+    assert core.get_state() == RecordingState.RECORDING
+    assert calls == ["start"]
+
+def test_consecutive_errors_are_coalesced(state_machine):
+    """Test that an error storm raised during one event yields a single ERROR transition."""
+    changes = []
+
+    def on_change(old, new, event):
+        changes.append(event)
+        if new == RecordingState.RECORDING:
+            for _ in range(3):
+                state_machine.handle_event(RecordingEvent.ERROR_OCCURRED, error=RuntimeError("boom"))
+
+    state_machine.state_changed.connect(on_change)
+    state_machine.handle_event(RecordingEvent.START_REQUESTED)
+    assert state_machine.get_state() == RecordingState.ERROR
+    assert changes == [RecordingEvent.START_REQUESTED, RecordingEvent.ERROR_OCCURRED]
+
+def test_invalid_events_are_rate_limited(state_machine):
+    """Test that a burst of invalid events is reported only once."""
+    errors = []
+    state_machine.error_occurred.connect(errors.append)
+
+    for _ in range(5):
+        state_machine.handle_event(RecordingEvent.CLEANUP_COMPLETED)
+    assert errors == ["Invalid event CLEANUP_COMPLETED for state IDLE"]
+    assert state_machine.get_state() == RecordingState.IDLE
+
+def test_handle_events_batch(state_machine):
+    """Test that a batch of events runs every transition and handler in order."""
+    changes = []
+    calls = []
+    state_machine.state_changed.connect(lambda old, new, event: changes.append(new))
+    state_machine.on_start_recording = lambda: calls.append("start")
+    state_machine.on_stop_recording = lambda: calls.append("stop")
+
+    state_machine.handle_events(RecordingEvent.START_REQUESTED,
+                                RecordingEvent.STOP_REQUESTED,
+                                RecordingEvent.CLEANUP_COMPLETED)
+    assert state_machine.get_state() == RecordingState.FINISHED
+    assert changes == [RecordingState.RECORDING, RecordingState.STOPPING, RecordingState.FINISHED]
+    assert calls == ["start", "stop"]
+
+def test_state_settled_coalesces_transitions(state_machine):
+    """Test that a burst of transitions is delivered once through the event loop."""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    settled = []
+    state_machine.state_settled.connect(lambda old, new, event: settled.append((old, new, event)))
+
+    state_machine.handle_events(RecordingEvent.START_REQUESTED,
+                                RecordingEvent.STOP_REQUESTED,
+                                RecordingEvent.CLEANUP_COMPLETED)
+    assert settled == []
+
+    app.processEvents()
+    assert settled == [(RecordingState.IDLE, RecordingState.FINISHED, RecordingEvent.CLEANUP_COMPLETED)]
@@ -0,0 +1,155 @@
+"""
+Pytest tests for the audio ring buffers and buffer pool.
+
+Run with: PYTHONPATH=src pytest tests/test_audio/test_ring_buffer.py
+"""
+
+import numpy as np
+import pytest
+from audio.ring_buffer import (
+    BlockRingBuffer, SampleRingBuffer, BufferPool, aligned_empty, SIMD_ALIGNMENT
+)
+
+def _block(value, frames=4, channels=2):
+    return np.full((frames, channels), value, dtype=np.int16)
+
+def test_aligned_empty_is_aligned():
+    """Test that aligned buffers start on the SIMD boundary."""
+    for shape in [(7,), (5, 3), (2, 3, 4)]:
+        buf = aligned_empty(shape, dtype=np.int16)
+        assert buf.shape == shape
+        assert buf.ctypes.data % SIMD_ALIGNMENT == 0
+        assert buf.flags.c_contiguous
+
+def test_block_ring_wraps_in_order():
+    """Test that blocks come out in order across the slot wrap-around."""
+    ring = BlockRingBuffer(capacity=3, blocksize=4, channels=2)
+    out = []
+    for value in range(10):
+        assert ring.push(_block(value))
+        block = ring.peek()
+        out.append(int(block[0, 0]))
+        ring.advance()
+    assert out == list(range(10))
+    assert len(ring) == 0
+    assert ring.peek() is None
+
+def test_block_ring_short_block():
+    """Test that a block shorter than blocksize is returned at its own length."""
+    ring = BlockRingBuffer(capacity=2, blocksize=4, channels=2)
+    ring.push(_block(1, frames=3))
+    assert ring.peek().shape == (3, 2)
+
+def test_block_ring_drops_when_full():
+    """Test that pushes into a full ring are rejected and counted."""
+    ring = BlockRingBuffer(capacity=2, blocksize=4, channels=2)
+    assert ring.push(_block(1))
+    assert ring.push(_block(2))
+    assert not ring.push(_block(3))
+    assert not ring.push(_block(4))
+    assert ring.dropped_blocks == 2
+    assert len(ring) == 2
+
+    # Dropped blocks never overwrite unread ones
+    assert ring.peek()[0, 0] == 1
+    ring.advance()
+    assert ring.push(_block(5))
+    values = []
+    while len(ring):
+        values.append(int(ring.peek()[0, 0]))
+        ring.advance()
+    assert values == [2, 5]
+
+def test_block_ring_advance_and_reset():
+    """Test that advance on an empty ring is a no-op and reset clears counters."""
+    ring = BlockRingBuffer(capacity=1, blocksize=4, channels=1)
+    ring.advance()
+    assert len(ring) == 0
+    ring.push(_block(1, channels=1))
+    ring.push(_block(2, channels=1))
+    ring.reset()
+    assert len(ring) == 0
+    assert ring.dropped_blocks == 0
+    assert ring.peek() is None
+
+def test_sample_ring_wraps():
+    """Test that writes past capacity keep the newest samples in order."""
+    ring = SampleRingBuffer(5, dtype=np.int16)
+    ring.write(np.arange(3, dtype=np.int16))
+    assert list(ring.latest()) == [0, 1, 2]
+    ring.write(np.arange(3, 7, dtype=np.int16))
+    assert len(ring) == 5
+    assert list(ring.latest()) == [2, 3, 4, 5, 6]
+
+def test_sample_ring_oversized_write():
+    """Test that a write longer than capacity keeps only its tail."""
+    ring = SampleRingBuffer(4, dtype=np.int16)
+    ring.write(np.array([9], dtype=np.int16))
+    ring.write(np.arange(10, dtype=np.int16).reshape(5, 2))
+    assert len(ring) == 4
+    assert list(ring.latest()) == [6, 7, 8, 9]
+
+def test_sample_ring_latest_across_wrap():
+    """Test that latest() linearizes reads that span the wrap point."""
+    ring = SampleRingBuffer(6, dtype=np.int16)
+    data = np.arange(20, dtype=np.int16)
+    ring.write(data[:4])
+    ring.write(data[4:9])  # head is now mid-ring, data wraps
+    for count in range(1, 7):
+        assert list(ring.latest(count)) == list(data[9 - count:9])
+    # Asking for more than is buffered returns what there is
+    assert list(ring.latest(50)) == list(data[3:9])
+
+def test_sample_ring_latest_into_out():
+    """Test that latest() fills a caller-provided buffer."""
+    ring = SampleRingBuffer(4, dtype=np.float32)
+    for value in range(6):
+        ring.append(value)
+    out = np.zeros(4, dtype=np.float32)
+    result = ring.latest(3, out=out)
+    assert np.shares_memory(result, out)
+    assert list(result) == [3, 4, 5]
+
+def test_sample_ring_clear():
+    """Test that clear empties the ring."""
+    ring = SampleRingBuffer(4)
+    ring.write(np.ones(3, dtype=np.float32))
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.latest().size == 0
+
+def test_buffer_pool_exhaustion_and_return():
+    """Test that an empty pool allocates and counts misses, and release refills it."""
+    pool = BufferPool(2, (4, 1), dtype=np.int16)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert len(pool) == 0
+    assert pool.misses == 0
+
+    extra = pool.acquire()
+    assert pool.misses == 1
+    assert extra.shape == (4, 1) and extra.dtype == np.int16
+
+    pool.release(first)
+    pool.release(second)
+    pool.release(extra)  # beyond pool_size
+    assert len(pool) == 2
+    assert pool.acquire() is first
+
+def test_buffer_pool_ignores_foreign_buffers():
+    """Test that buffers of another shape or dtype are not pooled."""
+    pool = BufferPool(2, (4, 1), dtype=np.int16)
+    pool.acquire()
+    pool.release(np.empty((5, 1), dtype=np.int16))
+    pool.release(np.empty((4, 1), dtype=np.float32))
+    assert len(pool) == 1
+
+def test_buffer_pool_borrowed_releases_on_error():
+    """Test that borrowed() returns the buffer even when the body raises."""
+    pool = BufferPool(1, (2,), dtype=np.int16)
+    with pytest.raises(RuntimeError):
+        with pool.borrowed() as buf:
+            assert len(pool) == 0
+            raise RuntimeError
+    assert len(pool) == 1
+    assert pool.acquire() is buf
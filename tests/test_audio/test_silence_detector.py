@@ -0,0 +1,92 @@
+"""
+Pytest tests for the silence detector.
+
+Run with: PYTHONPATH=src pytest tests/test_audio/test_silence_detector.py
+"""
+
+import time
+
+import numpy as np
+import pytest
+from audio.silence_detector import SilenceDetector, SilenceConfig, DetectionStrategy, SAMPLE_RATE
+
+@pytest.fixture
+def rms_detector():
+    """Create an RMS-strategy detector and stop it afterwards."""
+    detector = SilenceDetector(SilenceConfig(primary_strategy=DetectionStrategy.RMS))
+    yield detector
+    detector.stop()
+
+def test_envelope_strategy_keeps_samples(rms_detector):
+    """Test that envelope-only strategies still buffer the audio for transcription."""
+    rms_detector.start()
+    assert rms_detector.wants_samples()
+    assert rms_detector.wants_envelope()
+
+    block = (np.arange(1024, dtype=np.int16) % 200 - 100).reshape(-1, 1)
+    sum_sq = int(np.sum(block.astype(np.int64) ** 2))
+    for _ in range(4):
+        # Same feeding sequence as AudioRecorder._feed_silence_detector
+        rms_detector.add_audio_data_int16(block)
+        rms_detector.add_envelope(100, sum_sq, len(block))
+
+    buffered = rms_detector.get_audio_buffer()
+    assert buffered is not None
+    assert len(buffered) == 2 * rms_detector.config.window_size
+
+def test_envelope_learning_is_measured_in_frames(rms_detector):
+    """Test that noise learning lasts noise_learning_duration regardless of block size."""
+    blocksize = 4096
+    needed = int(rms_detector.config.noise_learning_duration * SAMPLE_RATE)
+    blocks = -(-needed // blocksize)
+
+    for _ in range(blocks - 1):
+        rms_detector._analyze_envelope(50, 50 * 50 * blocksize, blocksize)
+    assert rms_detector.is_learning
+
+    rms_detector._analyze_envelope(50, 50 * 50 * blocksize, blocksize)
+    assert not rms_detector.is_learning
+
+def _wait_for(condition, timeout=2.0):
+    """Wait until condition() holds for the analysis thread's state."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "analysis thread did not catch up"
+        time.sleep(0.001)
+
+def test_window_learning_is_measured_in_frames():
+    """Test that windowed analysis of large blocks learns for noise_learning_duration."""
+    detector = SilenceDetector(SilenceConfig(primary_strategy=DetectionStrategy.HYBRID))
+    blocksize = 4096
+    needed = int(detector.config.noise_learning_duration * SAMPLE_RATE)
+    blocks = -(-needed // blocksize)
+    block = np.full((blocksize, 1), 50, dtype=np.int16)
+
+    detector.start()
+    try:
+        for fed in range(1, blocks):
+            # One block at a time, so each is analyzed as its own backlog
+            detector.add_audio_data_int16(block)
+            _wait_for(lambda: not detector.is_learning or detector.noise_frames >= fed * blocksize)
+        assert detector.is_learning
+
+        detector.add_audio_data_int16(block)
+        _wait_for(lambda: not detector.is_learning)
+    finally:
+        detector.stop()
+
+def test_analysis_consumes_whole_hops():
+    """Test that a partial hop is carried over to the next analysis."""
+    detector = SilenceDetector(SilenceConfig(primary_strategy=DetectionStrategy.HYBRID))
+    hop = detector.config.hop_size
+    block = np.zeros((detector.config.window_size + hop // 2, 1), dtype=np.int16)
+
+    detector.start()
+    try:
+        detector.add_audio_data_int16(block)
+        _wait_for(lambda: detector._samples_analyzed == 2 * hop)
+        detector.add_audio_data_int16(block)
+        _wait_for(lambda: detector._samples_analyzed == 5 * hop)
+        assert detector._audio_clock == 5 * hop
+    finally:
+        detector.stop()
@@ -0,0 +1,117 @@
+"""
+Pytest tests for the configuration manager.
+
+Run with: PYTHONPATH=src pytest tests/test_config/test_config_manager.py
+"""
+
+import json
+import os
+
+import pytest
+from config import config_manager as config_manager_module
+from config.config_manager import ConfigManager, get_config_manager
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """Create a config manager whose ~/.config lives in a temporary directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ConfigManager()
+
+def test_defaults_created(config_manager):
+    """Test that a fresh config file is created with schema defaults."""
+    assert config_manager.get_config_value('audio', 'sample_rate') == 16000
+    assert config_manager.get_config_value('transcription', 'model') == 'tiny'
+
+def test_set_value_round_trip(config_manager):
+    """Test that a user-editable value is saved and read back by a new manager."""
+    assert config_manager.set_config_value('audio', 'save_path', '/tmp/récordings')
+    assert ConfigManager().get_config_value('audio', 'save_path') == '/tmp/récordings'
+
+def test_rejects_system_only_and_invalid_values(config_manager):
+    """Test that system-only settings and out-of-range values are rejected."""
+    assert not config_manager.set_config_value('audio', 'sample_rate', 8000)
+    assert not config_manager.set_config_value('audio', 'buffer_size', 100)
+    assert config_manager.get_config_value('audio', 'buffer_size') == 5
+
+def test_batch_update_saves_once(config_manager, monkeypatch):
+    """Test that changes inside batch_update() are written with a single save."""
+    saves = []
+    original_save = config_manager.save_config
+    monkeypatch.setattr(config_manager, 'save_config', lambda: (saves.append(1), original_save()))
+
+    with config_manager.batch_update():
+        config_manager.set_config_value('audio', 'buffer_size', 7)
+        config_manager.set_config_value('audio', 'silence_duration', 3.0)
+        assert saves == []
+
+    assert saves == [1]
+    assert ConfigManager().get_config_value('audio', 'buffer_size') == 7
+
+def test_batch_update_error_skips_save(config_manager, monkeypatch):
+    """Test that an exception inside batch_update() propagates and nothing is saved."""
+    def failing_save():
+        raise OSError("disk full")
+    monkeypatch.setattr(config_manager, 'save_config', failing_save)
+
+    with pytest.raises(ValueError):
+        with config_manager.batch_update():
+            config_manager.set_config_value('audio', 'buffer_size', 7)
+            raise ValueError("bad input")
+
+    assert config_manager._dirty
+    assert config_manager._batch_depth == 0
+    assert ConfigManager().get_config_value('audio', 'buffer_size') == 5
+
+def test_cache_tracks_external_edits(config_manager):
+    """Test that the parsed-config cache is bypassed once config.json changes."""
+    assert os.path.exists(config_manager._cache_file)
+    assert ConfigManager().get_config_value('audio', 'buffer_size') == 5
+
+    with open(config_manager.config_file, encoding='utf-8') as f:
+        data = json.load(f)
+    data['audio']['buffer_size'] = 12
+    with open(config_manager.config_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4)
+    assert ConfigManager().get_config_value('audio', 'buffer_size') == 12
+
+def test_unchanged_value_is_not_saved(config_manager, monkeypatch):
+    """Test that setting a value to its current value does not rewrite the file."""
+    saves = []
+    monkeypatch.setattr(config_manager, 'save_config', lambda: saves.append(1))
+
+    assert config_manager.set_config_value('audio', 'buffer_size', 5)
+    config_manager.reset_to_defaults('audio')
+    assert saves == []
+
+def test_invalid_and_missing_values_are_repaired(config_manager):
+    """Test that loading repairs out-of-range and missing values and saves the repair."""
+    with open(config_manager.config_file, encoding='utf-8') as f:
+        data = json.load(f)
+    data['audio']['buffer_size'] = 1000
+    del data['gui']
+    with open(config_manager.config_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    repaired = ConfigManager()
+    assert repaired.get_config_value('audio', 'buffer_size') == 5
+    assert repaired.get_config_value('gui', 'theme') == 'default'
+    with open(config_manager.config_file, encoding='utf-8') as f:
+        assert json.load(f)['audio']['buffer_size'] == 5
+
+def test_get_config_manager_is_shared(tmp_path, monkeypatch):
+    """Test that get_config_manager() creates one instance and reuses it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(config_manager_module, '_instance', None)
+
+    shared = get_config_manager()
+    assert isinstance(shared, ConfigManager)
+    assert get_config_manager() is shared
+
+def test_settings_views_follow_changes(config_manager):
+    """Test that cached settings views are reused and refreshed after a change."""
+    editable = config_manager.get_user_editable_settings()
+    assert config_manager.get_user_editable_settings() is editable
+    assert editable['audio']['buffer_size']['value'] == 5
+
+    config_manager.set_config_value('audio', 'buffer_size', 8)
+    assert config_manager.get_user_editable_settings()['audio']['buffer_size']['value'] == 8